@@ -36,13 +36,26 @@ def get_tenant_identity_providers(communication, tenant_id: str):
         return []
 
 
+# Cached authcfg id, kept in sync by the functions in this module that write it
+_authcfg_id = None
+
+
 def get_authcfg_id():
-    settings = QSettings()
-    authcfg_id = settings.value(RANA_AUTHCFG_ENTRY)
-    return authcfg_id
+    global _authcfg_id
+    if _authcfg_id is None:
+        settings = QSettings()
+        _authcfg_id = settings.value(RANA_AUTHCFG_ENTRY)
+    return _authcfg_id
+
+
+def _store_authcfg_id(settings: QSettings, authcfg_id: str):
+    global _authcfg_id
+    settings.setValue(RANA_AUTHCFG_ENTRY, authcfg_id)
+    _authcfg_id = authcfg_id
 
 
 def remove_authcfg(communication: UICommunication):
+    global _authcfg_id
     settings = QSettings()
     authcfg_id = settings.value(RANA_AUTHCFG_ENTRY)
     auth_manager = QgsApplication.authManager()
@@ -51,6 +64,7 @@ def remove_authcfg(communication: UICommunication):
         return False
 
     settings.remove(RANA_AUTHCFG_ENTRY)
+    _authcfg_id = None
     return True
 
 
@@ -70,7 +84,7 @@ def setup_oauth2(communication: UICommunication, start_tenant_id) -> bool:
 
     if authcfg_id:
         communication.log_info("Authentication already configured")
-        settings.setValue(RANA_AUTHCFG_ENTRY, authcfg_id)
+        _store_authcfg_id(settings, authcfg_id)
         return True
 
     tenant_id = get_tenant_id() if not start_tenant_id else start_tenant_id
@@ -153,7 +167,7 @@ def setup_oauth2(communication: UICommunication, start_tenant_id) -> bool:
     auth_manager.storeAuthenticationConfig(authcfg)
     new_authcfg_id = authcfg.id()
     if new_authcfg_id:
-        settings.setValue(RANA_AUTHCFG_ENTRY, new_authcfg_id)
+        _store_authcfg_id(settings, new_authcfg_id)
     else:
         communication.log_warn("Failed to create OAuth2 configuration")
         return False
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +28,7 @@ from rana_qgis_plugin.utils.qgis import (
     get_threedi_results_analysis_tool_instance,
 )
 from rana_qgis_plugin.utils.scenario import get_is_3di_simulation
+from rana_qgis_plugin.utils.settings import set_file_last_modified
 
 
 class LayerManager(QObject):
@@ -77,10 +79,20 @@ class LayerManager(QObject):
         if not layers:
             self.communication.show_warn(f"No layers found in {file_name}.")
             return
+        # Register all layers of the file at once to avoid per-layer project updates
+        vector_layers = []
+        qml_names = self._get_qml_names(local_file_path)
         for file_layer in layers:
-            self._add_layers_from_vector_file(
-                file_layer["name"], local_file_path, file, parents=parents
+            layer = self._create_vector_layer(
+                file_layer["name"], local_file_path, qml_names
             )
+            if layer:
+                vector_layers.append(layer)
+            else:
+                self.communication.show_error(
+                    f"Failed to add {file_layer['name']} layer from: {file_name}"
+                )
+        self.add_layers(vector_layers, parents)
         self.communication.bar_info(
             f"Added layers from {file_name}"
             + (f" to group {'/'.join(parents)}." if parents else ".")
@@ -93,25 +105,47 @@ class LayerManager(QObject):
         file: dict,
         parents: Optional[list[str]] = None,
     ):
-        layer_uri = f"{local_file_path}|layername={layer_name}"
-        layer = self._create_and_add_layer(
-            QgsVectorLayer,
-            layer_args=[layer_uri, layer_name, "ogr"],
-            parents=parents,
+        layer = self._create_vector_layer(
+            layer_name, local_file_path, self._get_qml_names(local_file_path)
         )
         if layer:
-            qml_path = Path(local_file_path).parent.joinpath(
-                get_qml_name_for_layer(layer_name)
-            )
-            if qml_path.exists():
-                layer.loadNamedStyle(str(qml_path))
-                layer.triggerRepaint()
-            self._unlock_layer(layer)
+            self.add_layer(layer, parents)
         else:
             self.communication.show_error(
                 f"Failed to add {layer_name} layer from: {Path(file['id']).name}"
             )
 
+    @staticmethod
+    def _get_qml_names(local_file_path: str) -> dict[str, str]:
+        """List the QML files next to the file once, instead of a stat per layer
+
+        Maps the casefolded name to the actual name, so matching stays case
+        insensitive like a file lookup on Windows and macOS.
+        """
+        try:
+            with os.scandir(Path(local_file_path).parent) as entries:
+                return {
+                    entry.name.casefold(): entry.name
+                    for entry in entries
+                    if entry.name.casefold().endswith(".qml")
+                }
+        except OSError:
+            return {}
+
+    def _create_vector_layer(
+        self, layer_name, local_file_path: str, qml_names: dict[str, str]
+    ) -> Optional[QgsVectorLayer]:
+        """Create a styled vector layer for a layer in the file, without adding it"""
+        layer_uri = f"{local_file_path}|layername={layer_name}"
+        layer = QgsVectorLayer(layer_uri, layer_name, "ogr")
+        if not layer.isValid():
+            return None
+        qml_name = qml_names.get(get_qml_name_for_layer(layer_name).casefold())
+        if qml_name:
+            layer.loadNamedStyle(str(Path(local_file_path).parent.joinpath(qml_name)))
+        self._unlock_layer(layer)
+        return layer
+
     def _add_layer_from_scenario(self, local_file_path: str, file: dict, project: str):
         # if zip file, do nothing, else try to load in results analysis
         if local_file_path.endswith(".zip"):
@@ -146,6 +180,11 @@ class LayerManager(QObject):
                 )
 
     def add_layer(self, layer, parents: Optional[list[str]] = None):
+        self.add_layers([layer], parents)
+
+    def add_layers(self, layers: list, parents: Optional[list[str]] = None):
+        if not layers:
+            return
         root = self.root
         if parents:
             for parent in parents:
@@ -153,29 +192,38 @@ class LayerManager(QObject):
                     root = root.addGroup(parent)
                 else:
                     root = root.findGroup(parent)
-        # Check if layer with same name and source already exists in root
-        child_layers = [
-            child.layer() for child in root.children() if hasattr(child, "layer")
-        ]
-        existing_layer = next(
-            (
-                child_layer
-                for child_layer in child_layers
-                if child_layer.name() == layer.name()
-                and child_layer.source() == layer.source()
-            ),
-            None,
-        )
-        insert_index = len(root.children())
-        # If the layer already exists, remove it first and then replace with the current layer
-        if existing_layer:
-            # Get the index of the existing layer before removing it
-            existing_node = root.findLayer(existing_layer.id())
-            if existing_node:
-                insert_index = existing_node.parent().children().index(existing_node)
-            self.project_inst.removeMapLayer(existing_layer.id())
-        self.project_inst.addMapLayer(layer, False)
-        root.insertLayer(insert_index, layer)
+        # Register all layers with a single call, so the project emits its
+        # layer added signals once for the whole batch
+        self.project_inst.addMapLayers(layers, False)
+        new_layer_ids = {layer.id() for layer in layers}
+        for layer in layers:
+            # Check if layer with same name and source already exists in root
+            child_layers = [
+                child.layer()
+                for child in root.children()
+                if hasattr(child, "layer") and child.layer().id() not in new_layer_ids
+            ]
+            existing_layer = next(
+                (
+                    child_layer
+                    for child_layer in child_layers
+                    if child_layer.name() == layer.name()
+                    and child_layer.source() == layer.source()
+                ),
+                None,
+            )
+            insert_index = len(root.children())
+            # If the layer already exists, insert the current layer at its place
+            # and remove the existing one
+            if existing_layer:
+                existing_node = root.findLayer(existing_layer.id())
+                if existing_node:
+                    insert_index = (
+                        existing_node.parent().children().index(existing_node)
+                    )
+            root.insertLayer(insert_index, layer)
+            if existing_layer:
+                self.project_inst.removeMapLayer(existing_layer.id())
 
     def _create_and_add_layer(
         self, layer_class, parents: Optional[list[str]], layer_args: list
@@ -211,6 +259,7 @@ class LayerManager(QObject):
         )
 
     def _add_from_wms(self, file: dict, layers: list, parents: list[str]):
+        file_name = Path(file["id"]).name
         descriptor = get_tenant_file_descriptor(file["descriptor_id"])
         wms_link = next(
             (link for link in descriptor["links"] if link["rel"] == "wms"), None
@@ -222,12 +271,10 @@ class LayerManager(QObject):
             for layer in layers:
                 self._add_wms_for_layer(layer, wms_link, parents=parents)
             self.communication.bar_info(
-                f"Added layers from {Path(file['id']).name} to group {'/'.join(parents)}."
+                f"Added layers from {file_name} to group {'/'.join(parents)}."
             )
         else:
-            self.communication.show_error(
-                f"Cannot add wms layer(s) from {Path(file['id']).name}"
-            )
+            self.communication.show_error(f"Cannot add wms layer(s) from {file_name}")
 
     def add_from_schematisation(
         self,
@@ -271,8 +318,7 @@ class FileLayerManager(LayerManager):
         self.communication.clear_message_bar()
         parents = [project_name] + file["id"].split("/")[:-1]
         # Save the last modified date of the downloaded file in QSettings
-        last_modified_key = f"{project_name}/{file['id']}/last_modified"
-        QSettings().setValue(last_modified_key, file["last_modified"])
+        set_file_last_modified(project_name, file["id"], file["last_modified"])
         if file.get("data_type") == "scenario":
             descriptor = get_tenant_file_descriptor(file["descriptor_id"])
             if get_is_3di_simulation(descriptor):
@@ -321,8 +367,7 @@ class PublicationLayerManager(LayerManager):
     def add_from_file(self, project_name, local_file_path: str, file: dict):
         # Save the last modified date of the downloaded file in QSettings
         parents = [project_name, "publications"] + self.publication_tree
-        last_modified_key = f"{project_name}/{file['id']}/last_modified"
-        QSettings().setValue(last_modified_key, file["last_modified"])
+        set_file_last_modified(project_name, file["id"], file["last_modified"])
         if file.get("data_type") == "scenario" and self.layer_in_file:
             self.add_from_wms(project_name, file)
         elif file.get("data_type") == "raster":
@@ -587,11 +587,18 @@ class Loader(QObject):
                     )
                     skipped_files.append((file["id"], "no default result found"))
                     continue
+                if (
+                    local_schematisations is None
+                    and working_dir
+                    and scenario_info.has_3di_simulation
+                ):
+                    local_schematisations = list_local_schematisations(working_dir)
                 context = ResultsDownloadContext(
                     scenario_info,
                     project["slug"],
                     file["id"],
                     filename="results.zip",
+                    local_schematisations=local_schematisations,
                 )
                 downloaders.append(RanaRawResultsDownloader(project, file, context))
                 if result.get("attachment_url"):
@@ -600,6 +607,7 @@ class Loader(QObject):
                         project["slug"],
                         file["id"],
                         filename=map_result_to_file_name(result),
+                        local_schematisations=local_schematisations,
                     )
                     downloaders.append(RanaResultDownloader(result_context, result))
             else:
@@ -1220,9 +1228,20 @@ class Loader(QObject):
         Returns an empty list if the user cancels via the overwrite dialog.
         """
         downloaders = []
+        # All contexts resolve the same results folder, scan the working dir once
+        working_dir = hcc_working_dir()
+        local_schematisations = (
+            list_local_schematisations(working_dir)
+            if working_dir and scenario_info.has_3di_simulation
+            else None
+        )
         if download_raw:
             context = ResultsDownloadContext(
-                scenario_info, project["slug"], file["id"], filename="results.zip"
+                scenario_info,
+                project["slug"],
+                file["id"],
+                filename="results.zip",
+                local_schematisations=local_schematisations,
             )
             downloaders.append(RanaRawResultsDownloader(project, file, context))
         for result_id in result_ids:
@@ -1231,7 +1250,11 @@ class Loader(QObject):
             ][0]
             filename = map_result_to_file_name(result)
             context = ResultsDownloadContext(
-                scenario_info, project["slug"], file["id"], filename=filename
+                scenario_info,
+                project["slug"],
+                file["id"],
+                filename=filename,
+                local_schematisations=local_schematisations,
             )
             # Check whether the file already exists locally
             if context.local_file_path.exists():
@@ -9,7 +9,7 @@ from qgis.core import (
     QgsNetworkAccessManager,
     QgsProcessingException,
 )
-from qgis.PyQt.QtCore import QCoreApplication, QFile, QIODevice, QJsonDocument, QUrl
+from qgis.PyQt.QtCore import QEventLoop, QFile, QIODevice, QJsonDocument, QUrl
 from qgis.PyQt.QtGui import QImage
 from qgis.PyQt.QtNetwork import (
     QHttpMultiPart,
@@ -196,8 +196,15 @@ class NetworkManager(object):
         self._reply.finished.connect(self.fetch_finished)
         self._network_manager.requestTimedOut.connect(self.request_timeout)
 
-        while not self._reply.isFinished():
-            QCoreApplication.processEvents()
+        # Block on a local event loop until the reply finishes instead of
+        # spinning on processEvents()
+        if not self._reply.isFinished():
+            loop = QEventLoop()
+            self._reply.finished.connect(loop.quit)
+            loop.exec()
+        # The network access manager is shared, don't let connections pile up
+        # when this NetworkManager is reused for several requests
+        self._network_manager.requestTimedOut.disconnect(self.request_timeout)
 
         description = None
         self.last_http_status = self._reply.attribute(
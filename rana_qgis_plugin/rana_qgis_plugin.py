@@ -29,7 +29,11 @@ from rana_qgis_plugin.constant import (
 from rana_qgis_plugin.icons import login_icon, logout_icon, rana_icon, settings_icon
 from rana_qgis_plugin.loader import Loader
 from rana_qgis_plugin.processing.providers import RanaQgisPluginProvider
-from rana_qgis_plugin.utils.api import get_user_info, get_user_tenants
+from rana_qgis_plugin.utils.api import (
+    close_requests_session,
+    get_user_info,
+    get_user_tenants,
+)
 from rana_qgis_plugin.utils.generic import parse_url
 from rana_qgis_plugin.utils.local_paths import cleanup_folder
 from rana_qgis_plugin.utils.qgis import get_plugin_instance
@@ -286,6 +290,7 @@ class RanaQgisPlugin:
             self.dock_widget.deleteLater()
         if self.loader:
             self.loader.cleanup()
+        close_requests_session()
 
     def run(self, start_url: str = None):
         """Run method that loads and starts the plugin"""
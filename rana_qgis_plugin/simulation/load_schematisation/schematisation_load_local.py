@@ -39,6 +39,7 @@ class SchematisationLoad(uicls, basecls):
         self.tv_revisions_model = QStandardItemModel()
         self.revisions_tv.setModel(self.tv_revisions_model)
         self.selected_local_schematisation = selected_local_schematisation
+        self._last_load_enabled = None
         self.pb_load.clicked.connect(self.load_local_schematisation)
         self.pb_cancel.clicked.connect(self.cancel_load_local_schematisation)
         self.revisions_tv.selectionModel().selectionChanged.connect(
@@ -53,17 +54,16 @@ class SchematisationLoad(uicls, basecls):
         self.tv_revisions_model.setHorizontalHeaderLabels(header)
         local_schematisation = self.selected_local_schematisation
         wip_revision = local_schematisation.wip_revision
+        rows = []
         if wip_revision is not None:
-            number_item = QStandardItem(str(wip_revision.number))
-            number_item.setData(wip_revision, role=Qt.UserRole)
-            subdir_item = QStandardItem(wip_revision.sub_dir)
-            self.tv_revisions_model.appendRow([number_item, subdir_item])
-        for revision_number, local_revision in sorted(
-            local_schematisation.revisions.items(), key=lambda x: x[0], reverse=True
-        ):
-            number_item = QStandardItem(str(revision_number))
-            number_item.setData(local_revision, role=Qt.UserRole)
-            subdir_item = QStandardItem(local_revision.sub_dir)
+            rows.append((str(wip_revision.number), wip_revision))
+        local_revisions = local_schematisation.revisions
+        for revision_number in sorted(local_revisions, reverse=True):
+            rows.append((str(revision_number), local_revisions[revision_number]))
+        for number_text, revision in rows:
+            number_item = QStandardItem(number_text)
+            number_item.setData(revision, role=Qt.UserRole)
+            subdir_item = QStandardItem(revision.sub_dir)
             self.tv_revisions_model.appendRow([number_item, subdir_item])
         if self.tv_revisions_model.rowCount() > 0:
             row_idx = self.tv_revisions_model.index(0, 0)
@@ -75,18 +75,16 @@ class SchematisationLoad(uicls, basecls):
     def toggle_load_local_schematisation(self):
         """Toggle load button if any schematisation revision is selected."""
         selection_model = self.revisions_tv.selectionModel()
-        if selection_model.hasSelection():
-            self.pb_load.setEnabled(True)
-        else:
-            self.pb_load.setDisabled(True)
+        load_enabled = selection_model.hasSelection()
+        if load_enabled != self._last_load_enabled:
+            self.pb_load.setEnabled(load_enabled)
+            self._last_load_enabled = load_enabled
 
     def get_selected_local_revision(self):
         """Get currently selected local revision."""
         index = self.revisions_tv.currentIndex()
         if index.isValid():
-            current_row = index.row()
-            name_item = self.tv_revisions_model.item(current_row, 0)
-            local_revision = name_item.data(Qt.UserRole)
+            local_revision = index.sibling(index.row(), 0).data(Qt.UserRole)
         else:
             local_revision = None
         return local_revision
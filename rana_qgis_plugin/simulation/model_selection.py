@@ -3,7 +3,6 @@
 import logging
 import os
 from functools import partial
-from math import ceil
 from operator import attrgetter
 
 from qgis.PyQt import uic
@@ -43,11 +42,13 @@ class ModelSelectionDialog(uicls, basecls):
         self.schematisation_id = schematisation_id
         self.communication = communication
         self.threedi_api = threedi_api
+        self.tc = ThreediCalls(self.threedi_api)
         self.organisations = organisations
         self.simulation_templates = None
         self.model_pk = model_pk
         self.current_model = None
         self.model_is_loaded = False
+        self._last_load_enabled = None
         self.templates_model = QStandardItemModel()
         self.templates_tv.setModel(self.templates_model)
         self.templates_tv.selectionModel().selectionChanged.connect(
@@ -65,8 +66,7 @@ class ModelSelectionDialog(uicls, basecls):
 
     def refresh_templates_list(self):
         """Refresh simulation templates list if any model is selected."""
-        tc = ThreediCalls(self.threedi_api)
-        self.current_model = tc.fetch_3di_model(self.model_pk)
+        self.current_model = self.tc.fetch_3di_model(self.model_pk)
         self.templates_model.clear()
         self.fetch_simulation_templates()
         if self.templates_model.rowCount() > 0:
@@ -80,10 +80,10 @@ class ModelSelectionDialog(uicls, basecls):
     def toggle_load_model(self):
         """Toggle load button if any model is selected."""
         selection_model = self.templates_tv.selectionModel()
-        if selection_model.hasSelection():
-            self.pb_load.setEnabled(True)
-        else:
-            self.pb_load.setDisabled(True)
+        load_enabled = selection_model.hasSelection()
+        if load_enabled != self._last_load_enabled:
+            self.pb_load.setEnabled(load_enabled)
+            self._last_load_enabled = load_enabled
 
     def populate_organisations(self):
         """Populating organisations list inside combo box."""
@@ -103,8 +103,7 @@ class ModelSelectionDialog(uicls, basecls):
         """Switch to model organisation."""
         schematisation_id = self.schematisation_id
         try:
-            tc = ThreediCalls(self.threedi_api)
-            model_schematisation = tc.fetch_schematisation(schematisation_id)
+            model_schematisation = self.tc.fetch_schematisation(schematisation_id)
             model_schematisation_owner = model_schematisation.owner
             organisation = self.organisations.get(model_schematisation_owner)
             if organisation is not None:
@@ -121,24 +120,22 @@ class ModelSelectionDialog(uicls, basecls):
     def fetch_simulation_templates(self):
         """Fetching simulation templates list."""
         try:
-            tc = ThreediCalls(self.threedi_api)
             selected_model = self.current_model
             model_pk = selected_model.id
-            templates = tc.fetch_simulation_templates(
+            templates = self.tc.fetch_simulation_templates(
                 simulation__threedimodel__id=model_pk
             )
             self.templates_model.clear()
             header = ["Template ID", "Template name", "Creation date"]
             self.templates_model.setHorizontalHeaderLabels(header)
             for template in sorted(templates, key=attrgetter("id"), reverse=True):
-                id_item = QStandardItem(str(template.id))
-                name_item = QStandardItem(template.name)
-                name_item.setData(template, role=Qt.UserRole)
                 creation_date = (
                     template.created.strftime("%d-%m-%Y") if template.created else ""
                 )
-                creation_date_item = QStandardItem(creation_date)
-                self.templates_model.appendRow([id_item, name_item, creation_date_item])
+                row_texts = (str(template.id), template.name, creation_date)
+                row_items = [QStandardItem(text) for text in row_texts]
+                row_items[NAME_COLUMN_IDX].setData(template, role=Qt.UserRole)
+                self.templates_model.appendRow(row_items)
             for i in range(len(header)):
                 self.templates_tv.resizeColumnToContents(i)
             self.simulation_templates = templates
@@ -153,9 +150,8 @@ class ModelSelectionDialog(uicls, basecls):
         """Get currently selected simulation template."""
         index = self.templates_tv.currentIndex()
         if index.isValid():
-            current_row = index.row()
-            name_item = self.templates_model.item(current_row, NAME_COLUMN_IDX)
-            selected_template = name_item.data(Qt.UserRole)
+            name_index = index.sibling(index.row(), NAME_COLUMN_IDX)
+            selected_template = name_index.data(Qt.UserRole)
         else:
             selected_template = None
         return selected_template
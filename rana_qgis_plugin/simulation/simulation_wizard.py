@@ -7,7 +7,7 @@ from collections import OrderedDict, defaultdict
 from copy import deepcopy
 from datetime import datetime
 from functools import partial
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 from typing import List, Optional
 
 import pyqtgraph as pg
@@ -720,20 +720,26 @@ class BoundaryConditionsWidget(uicls_boundary_conditions, basecls_boundary_condi
             else:
                 # these need to be converted to seconds, if necessary
                 units = self.cbo_bc_units_1d.currentText()
-                bc_data = deepcopy(self.boundary_conditions_1d_timeseries)
-                for val in bc_data:
-                    val["values"] = convert_timeseries_to_seconds(val["values"], units)
-                bc_timeseries = bc_data
+                bc_timeseries = [
+                    {
+                        **val,
+                        "values": convert_timeseries_to_seconds(val["values"], units),
+                    }
+                    for val in self.boundary_conditions_1d_timeseries
+                ]
         else:
             if self.rb_from_template.isChecked():
                 bc_timeseries = self.template_boundary_conditions_2d_timeseries
             else:
                 # these need to be converted to seconds, if necessary
                 units = self.cbo_bc_units_2d.currentText()
-                bc_data = deepcopy(self.boundary_conditions_2d_timeseries)
-                for val in bc_data:
-                    val["values"] = convert_timeseries_to_seconds(val["values"], units)
-                bc_timeseries = bc_data
+                bc_timeseries = [
+                    {
+                        **val,
+                        "values": convert_timeseries_to_seconds(val["values"], units),
+                    }
+                    for val in self.boundary_conditions_2d_timeseries
+                ]
 
         return bc_timeseries
 
@@ -1833,7 +1839,7 @@ class BreachesWidget(uicls_breaches, basecls_breaches):
                 for f in self.potential_breaches_layer.getFeatures()
             }
             for breach_id, breach_fid in sorted(
-                breach_ids_map.items(), key=lambda i: i[1]
+                breach_ids_map.items(), key=itemgetter(1)
             ):
                 self.dd_breach_id.addItem(breach_id, breach_fid)
         self.breaches_model.setHorizontalHeaderLabels(self.breach_parameters.values())
@@ -266,9 +266,7 @@ class CheckModelWidget(uicls_check_page, basecls_check_page):
         total_checks = len(model_checker.config.checks)
 
         results_rows = defaultdict(list)
-        for i, check in enumerate(
-            model_checker.checks(level=LogLevels.INFO.value), start=1
-        ):
+        for i, check in enumerate(model_checker.checks(level=LogLevels.INFO), start=1):
             for result_row in check.get_invalid(session):
                 results_rows[check.error_code].append(
                     [
@@ -302,7 +300,7 @@ class CheckModelWidget(uicls_check_page, basecls_check_page):
         def progress_logger(progress, info):
             self.pbar_check_grid.setValue(int(progress * 100))
             self.grid_checker_logger.log_result_row(
-                [LogLevels.INFO.value.capitalize(), info], LogLevels.INFO.value
+                [LogLevels.INFO.capitalize(), info], LogLevels.INFO
             )
 
         self.pbar_check_grid.setMaximum(100)
@@ -328,12 +326,12 @@ class CheckModelWidget(uicls_check_page, basecls_check_page):
         except SchematisationError as e:
             err = f"Creating grid file failed with the following error: {repr(e)}"
             self.grid_checker_logger.log_result_row(
-                [LogLevels.ERROR.value.capitalize(), err], LogLevels.ERROR.value
+                [LogLevels.ERROR.capitalize(), err], LogLevels.ERROR
             )
         except Exception as e:
             err = f"Checking computational grid failed with the following error: {repr(e)}"
             self.grid_checker_logger.log_result_row(
-                [LogLevels.ERROR.value.capitalize(), err], LogLevels.ERROR.value
+                [LogLevels.ERROR.capitalize(), err], LogLevels.ERROR
             )
         finally:
             self.pbar_check_grid.setValue(100)
@@ -3,16 +3,17 @@
 import hashlib
 import json
 import os
+import shutil
 import tempfile
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
+from itertools import pairwise
 from operator import attrgetter
-from time import sleep
+from time import monotonic
 from typing import List
 from zipfile import ZIP_DEFLATED, ZipFile
 
-import requests
 from qgis.core import QgsVectorLayer
 from qgis.PyQt.QtCore import QSettings, Qt
 from qgis.PyQt.QtGui import (
@@ -30,9 +31,15 @@ from threedi_mi_utils import (
 )
 
 from rana_qgis_plugin.simulation.threedi_calls import ThreediCalls
+from rana_qgis_plugin.utils.api import get_requests_session
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class LogLevels(Enum):
+
+class LogLevels:
     """Model Checker log levels."""
 
     INFO = "INFO"
@@ -50,10 +57,10 @@ class TreeViewLogger(object):
         self.model = QStandardItemModel()
         self.tree_view.setModel(self.model)
         self.levels_colors = {
-            LogLevels.INFO.value: QColor(Qt.black),
-            LogLevels.WARNING.value: QColor(229, 144, 80),
-            LogLevels.ERROR.value: QColor(Qt.red),
-            LogLevels.FUTURE_ERROR.value: QColor(102, 51, 153),
+            LogLevels.INFO: QColor(Qt.black),
+            LogLevels.WARNING: QColor(229, 144, 80),
+            LogLevels.ERROR: QColor(Qt.red),
+            LogLevels.FUTURE_ERROR: QColor(102, 51, 153),
         }
         self.initialize_view()
 
@@ -95,6 +102,11 @@ BOUNDARY_CONDITIONS_TEMPLATE = os.path.join(CACHE_PATH, "boundary_conditions.jso
 LATERALS_FILE_TEMPLATE = os.path.join(CACHE_PATH, "laterals.json")
 DWF_FILE_TEMPLATE = os.path.join(CACHE_PATH, "dwf.json")
 CHUNK_SIZE = 1024**2
+DOWNLOAD_BUFFER_SIZE = CHUNK_SIZE * 8
+LARGE_DOWNLOAD_SIZE = CHUNK_SIZE * 64
+LARGE_DOWNLOAD_BUFFER_SIZE = CHUNK_SIZE * 16
+MAX_CONCURRENT_DOWNLOADS = 4
+PROGRESS_UPDATE_INTERVAL = 0.05  # seconds
 RADAR_ID = "d6c2347d-7bd1-4d9d-a1f6-b342c865516f"
 API_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
 USER_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -140,7 +152,7 @@ class FileState(Enum):
     REMOVED = "removed"
 
 
-class ThreediFileState(Enum):
+class ThreediFileState:
     """Possible 3Di file states."""
 
     PROCESSING = "processing"
@@ -148,7 +160,7 @@ class ThreediFileState(Enum):
     INVALID = "invalid"
 
 
-class ThreediModelTaskStatus(Enum):
+class ThreediModelTaskStatus:
     """Possible 3Di Model Task statuses."""
 
     PENDING = "pending"
@@ -171,28 +183,25 @@ int_to_numerical_diffusion_limiter = {
 }
 
 
+MMH_PER_MS = 3600 * 1000
+UNITS_TO_SECONDS = {"s": 1, "mins": 60, "hrs": 3600}
+
+
 def mmh_to_ms(mmh_value):
     """Converting values from 'mm/h' to the 'm/s'."""
-    ms_value = mmh_value / 3600 * 0.001
+    ms_value = mmh_value / MMH_PER_MS
     return ms_value
 
 
 def ms_to_mmh(ms_value):
     """Converting values from 'm/s' to the 'mm/h'."""
-    mmh_value = ms_value * 3600 * 1000
+    mmh_value = ms_value * MMH_PER_MS
     return mmh_value
 
 
 def mmtimestep_to_mmh(value, timestep, units="s"):
     """Converting values from 'mm/timestep' to the 'mm/h'."""
-    if units == "s":
-        timestep_seconds = timestep
-    elif units == "mins":
-        timestep_seconds = timestep * 60
-    elif units == "hrs":
-        timestep_seconds = timestep * 3600
-    else:
-        raise ValueError(f"Unsupported timestep units format ({units})!")
+    timestep_seconds = timestep * units_to_seconds(units)
     value_per_second = value / timestep_seconds
     mmh_value = value_per_second * 3600
     return mmh_value
@@ -200,14 +209,7 @@ def mmtimestep_to_mmh(value, timestep, units="s"):
 
 def mmh_to_mmtimestep(value, timestep, units="s"):
     """Converting values from 'mm/h' to the 'mm/timestep'."""
-    if units == "s":
-        timestep_seconds = timestep
-    elif units == "mins":
-        timestep_seconds = timestep * 60
-    elif units == "hrs":
-        timestep_seconds = timestep * 3600
-    else:
-        raise ValueError(f"Unsupported timestep units format ({units})!")
+    timestep_seconds = timestep * units_to_seconds(units)
     value_per_second = value / 3600
     mmtimestep_value = value_per_second * timestep_seconds
     return mmtimestep_value
@@ -215,15 +217,10 @@ def mmh_to_mmtimestep(value, timestep, units="s"):
 
 def units_to_seconds(units="s"):
     """Converting timestep to seconds."""
-    if units == "s":
-        seconds_per_unit = 1
-    elif units == "mins":
-        seconds_per_unit = 60
-    elif units == "hrs":
-        seconds_per_unit = 3600
-    else:
+    try:
+        return UNITS_TO_SECONDS[units]
+    except KeyError:
         raise ValueError(f"Unsupported timestep units format ({units})!")
-    return seconds_per_unit
 
 
 def convert_timeseries_to_seconds(timeseries, units="s"):
@@ -233,29 +230,42 @@ def convert_timeseries_to_seconds(timeseries, units="s"):
     return converted_timeseries
 
 
-def load_saved_templates():
-    """Loading parameters from saved template."""
-    items = OrderedDict()
-    with open(TEMPLATE_PATH, "a"):
-        os.utime(TEMPLATE_PATH, None)
-    with open(TEMPLATE_PATH, "r+") as json_file:
+_saved_templates_cache = None
+
+
+def _read_saved_templates():
+    """Return saved templates data, reading the template file only once."""
+    global _saved_templates_cache
+    if _saved_templates_cache is None:
         data = {}
-        if os.path.getsize(TEMPLATE_PATH):
-            data = json.load(json_file)
-        for name, parameters in sorted(data.items()):
-            items[name] = parameters
-    return items
+        if os.path.exists(TEMPLATE_PATH) and os.path.getsize(TEMPLATE_PATH):
+            data = read_json_data(TEMPLATE_PATH)
+        _saved_templates_cache = data
+    return _saved_templates_cache
+
+
+def load_saved_templates():
+    """Loading parameters from saved template, in the order they were saved."""
+    return dict(_read_saved_templates())
 
 
 def read_json_data(json_filepath):
     """Parse and return data from JSON file."""
-    with open(json_filepath, "r+") as json_file:
+    if orjson is not None:
+        with open(json_filepath, "rb") as json_file:
+            try:
+                return orjson.loads(json_file.read())
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity literals json.dump writes
+                pass
+    with open(json_filepath, "r") as json_file:
         data = json.load(json_file)
         return data
 
 
 def write_json_data(values, json_file_template):
     """Writing data to the JSON file."""
+    # Stdlib json on purpose: orjson would silently write NaN/Infinity as null
     with open(json_file_template, "w") as json_file:
         jsonf = json.dumps(values)
         json_file.write(jsonf)
@@ -263,23 +273,15 @@ def write_json_data(values, json_file_template):
 
 def write_template(template_name, simulation_template):
     """Writing parameters as a template."""
-    with open(TEMPLATE_PATH, "a"):
-        os.utime(TEMPLATE_PATH, None)
-    with open(TEMPLATE_PATH, "r+") as json_file:
-        data = {}
-        if os.path.getsize(TEMPLATE_PATH):
-            data = json.load(json_file)
-        data[template_name] = simulation_template
-        jsonf = json.dumps(data)
-        json_file.seek(0)
-        json_file.write(jsonf)
-        json_file.truncate()
+    data = _read_saved_templates()
+    data[template_name] = simulation_template
+    write_json_data(data, TEMPLATE_PATH)
 
 
 def upload_local_file(upload, filepath):
     """Upload file."""
-    with open(filepath, "rb") as file:
-        response = requests.put(upload.put_url, data=file)
+    with open(filepath, "rb", buffering=CHUNK_SIZE) as file:
+        response = get_requests_session().put(upload.put_url, data=file)
         return response
 
 
@@ -290,19 +292,24 @@ def file_cached(file_path):
 
 def get_download_file(download, file_path):
     """Getting file from Download object and writing it under given path."""
-    r = requests.get(download.get_url, stream=True, timeout=15)
-    with open(file_path, "wb") as f:
-        for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
-            if chunk:
-                f.write(chunk)
+    with get_requests_session().get(download.get_url, stream=True, timeout=15) as r:
+        r.raw.decode_content = True
+        content_length = int(r.headers.get("Content-Length") or 0)
+        if content_length > LARGE_DOWNLOAD_SIZE:
+            buffer_size = LARGE_DOWNLOAD_BUFFER_SIZE
+        else:
+            buffer_size = DOWNLOAD_BUFFER_SIZE
+        with open(file_path, "wb", buffering=buffer_size) as f:
+            shutil.copyfileobj(r.raw, f, length=buffer_size)
 
 
 def is_file_checksum_equal(file_path, etag):
     """Checking if etag (MD5 checksum) matches checksum calculated for a given file."""
+    md5 = hashlib.md5()
     with open(file_path, "rb") as file_to_check:
-        data = file_to_check.read()
-        md5_returned = hashlib.md5(data).hexdigest()
-        return etag == md5_returned
+        for chunk in iter(lambda: file_to_check.read(CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return etag == md5.hexdigest()
 
 
 def zip_into_archive(file_path, compression=ZIP_DEFLATED):
@@ -319,9 +326,9 @@ def unzip_archive(zip_filepath, location=None):
     if not location:
         location = os.path.dirname(zip_filepath)
     with ZipFile(zip_filepath, "r") as zf:
-        content_list = zf.namelist()
-        zf.extractall(location)
-        return content_list
+        members = zf.infolist()
+        zf.extractall(location, members=members)
+        return [member.filename for member in members]
 
 
 def extract_error_message(e):
@@ -330,11 +337,10 @@ def extract_error_message(e):
     try:
         if isinstance(error_body, str):
             error_body = json.loads(error_body)
-        if "detail" in error_body:
-            error_details = error_body["detail"]
-        elif "details" in error_body:
-            error_details = error_body["details"]
-        elif "errors" in error_body:
+        for details_key in ("detail", "details"):
+            if details_key in error_body:
+                return f"Error: {error_body[details_key]}"
+        if "errors" in error_body:
             errors = error_body["errors"]
             try:
                 error_parts = [
@@ -348,8 +354,7 @@ def extract_error_message(e):
             error_details = str(error_body)
     except json.JSONDecodeError:
         error_details = str(error_body)
-    error_msg = f"Error: {error_details}"
-    return error_msg
+    return f"Error: {error_details}"
 
 
 def handle_csv_header(header: List[str]):
@@ -381,21 +386,15 @@ def apply_24h_timeseries(start_datetime, end_datetime, timeseries):
     extended_flow_ts = flow_ts + flow_ts[1:] * (
         full_days_duration - 1
     )  # skipping 0.0 time step while extending TS
-    full_days_seconds_range = range(0, full_days_sec + hour_in_sec, hour_in_sec)
+    full_days_steps = full_days_sec // hour_in_sec + 1
     start_time_delta = start_datetime - start_day
     end_time_delta = end_datetime - start_day
-    start_timestep = (start_time_delta.total_seconds() // hour_in_sec) * hour_in_sec
-    end_timestep = (end_time_delta.total_seconds() // hour_in_sec) * hour_in_sec
-    timestep = 0.0
-    new_timeseries = []
-    for extended_timestep, flow in zip(full_days_seconds_range, extended_flow_ts):
-        if extended_timestep < start_timestep:
-            continue
-        elif end_timestep >= extended_timestep >= start_timestep:
-            new_timeseries.append((timestep, flow))
-            timestep += hour_in_sec
-        else:
-            break
+    start_idx = int(start_time_delta.total_seconds() // hour_in_sec)
+    end_idx = int(end_time_delta.total_seconds() // hour_in_sec)
+    flow_window = extended_flow_ts[:full_days_steps][start_idx : end_idx + 1]
+    new_timeseries = [
+        (float(i * hour_in_sec), flow) for i, flow in enumerate(flow_window)
+    ]
     return new_timeseries
 
 
@@ -410,36 +409,42 @@ def split_to_even_chunks(collection, chunk_length):
 def intervals_are_even(time_series):
     """Check if intervals in the time series are all even."""
     expected_interval = time_series[1][0] - time_series[0][0]
-    time_steps = [time_step for time_step, value in time_series]
-    for start_time_step, end_time_step in zip(time_steps, time_steps[1:]):
-        if end_time_step - start_time_step != expected_interval:
-            return False
-    return True
+    return all(
+        end_time_step - start_time_step == expected_interval
+        for (start_time_step, _), (end_time_step, _) in pairwise(time_series)
+    )
 
 
 def parse_version_number(version_str):
     """Parse version number in a string format and convert it into list of an integers."""
-    version = [int(i) for i in version_str.split(".") if i.isnumeric()]
+    version = [int(i) for i in version_str.split(".") if i.isdecimal()]
     return version
 
 
 def constains_only_ascii(text):
-    return all(ord(c) < 128 for c in text)
+    return text.isascii()
 
 
 def parse_timeseries(timeseries: str):
     """Parse the timeseries from the given string."""
-    return [[float(f) for f in line.split(",")] for line in timeseries.split("\n")]
+    return [list(map(float, line.split(","))) for line in timeseries.split("\n")]
+
+
+ILLEGAL_CHARACTERS = r'\/:*?"<>|'
+ILLEGAL_CHARACTERS_TABLE = str.maketrans(dict.fromkeys(ILLEGAL_CHARACTERS, "-"))
 
 
 def translate_illegal_chars(
-    text, illegal_characters=r'\/:*?"<>|', replacement_character="-"
+    text, illegal_characters=ILLEGAL_CHARACTERS, replacement_character="-"
 ):
     """Remove illegal characters from the text."""
-    sanitized_text = "".join(
-        char if char not in illegal_characters else replacement_character
-        for char in text
-    )
+    if illegal_characters == ILLEGAL_CHARACTERS and replacement_character == "-":
+        translation_table = ILLEGAL_CHARACTERS_TABLE
+    else:
+        translation_table = str.maketrans(
+            dict.fromkeys(illegal_characters, replacement_character)
+        )
+    sanitized_text = text.translate(translation_table)
     return sanitized_text
 
 
@@ -451,202 +456,140 @@ def geopackage_layer(gpkg_path, table_name, layer_name=None):
     return vlayer
 
 
-def extract_error_message(e):
-    """Extracting useful information from ApiException exceptions."""
-    error_body = e.body
-    try:
-        if isinstance(error_body, str):
-            error_body = json.loads(error_body)
-        if "detail" in error_body:
-            error_details = error_body["detail"]
-        elif "details" in error_body:
-            error_details = error_body["details"]
-        elif "errors" in error_body:
-            errors = error_body["errors"]
-            try:
-                error_parts = [
-                    f"{err['reason']} ({err['instance']['related_object']})"
-                    for err in errors
-                ]
-            except TypeError:
-                error_parts = list(errors.values())
-            error_details = "\n" + "\n".join(error_parts)
-        else:
-            error_details = str(error_body)
-    except json.JSONDecodeError:
-        error_details = str(error_body)
-    return f"Error: {error_details}"
-
-
 class NestedObject:
     """A class to convert a nested dictionary into an object."""
 
     def __init__(self, data):
-        for key, value in data.items():
-            if isinstance(value, (list, tuple)):
-                setattr(
-                    self,
-                    key,
-                    [NestedObject(x) if isinstance(x, dict) else x for x in value],
-                )
-            else:
-                setattr(
-                    self, key, NestedObject(value) if isinstance(value, dict) else value
-                )
+        self.__dict__.update(
+            {key: self._convert_value(value) for key, value in data.items()}
+        )
+
+    @classmethod
+    def _convert_value(cls, value):
+        if isinstance(value, (list, tuple)):
+            return [cls(x) if isinstance(x, dict) else x for x in value]
+        return cls(value) if isinstance(value, dict) else value
 
 
 class SchematisationRasterReferences:
-    @staticmethod
-    def settings_to_api_raster_types():
-        raster_type_map = {
-            "friction_coefficient_file": "frict_coef_file",
-            "max_infiltration_volume_file": "max_infiltration_capacity_file",
-            "groundwater_hydraulic_conductivity_file": "groundwater_hydro_connectivity_file",
-            "initial_water_level_file": "initial_waterlevel_file",
-        }
-        return raster_type_map
+    _SETTINGS_TO_API_RASTER_TYPES = {
+        "friction_coefficient_file": "frict_coef_file",
+        "max_infiltration_volume_file": "max_infiltration_capacity_file",
+        "groundwater_hydraulic_conductivity_file": "groundwater_hydro_connectivity_file",
+        "initial_water_level_file": "initial_waterlevel_file",
+    }
+    _API_TO_SETTINGS_RASTER_TYPES = {
+        v: k for k, v in _SETTINGS_TO_API_RASTER_TYPES.items()
+    }
+    _MODEL_SETTINGS_RASTERS = {
+        "dem_file": "Digital elevation model [m MSL]",
+        "friction_coefficient_file": "Friction coefficient [-]",
+    }
+    _INITIAL_CONDITIONS_RASTERS = {
+        "initial_groundwater_level_file": "Initial groundwater level [m MSL]",
+        "initial_water_level_file": "Initial water level [m MSL]",
+    }
+    _INTERCEPTION_RASTERS = {"interception_file": "Interception [m]"}
+    _SIMPLE_INFILTRATION_RASTERS = {
+        "infiltration_rate_file": "Infiltration rate [mm/d]",
+        "max_infiltration_volume_file": "Max infiltration volume [m]",
+    }
+    _GROUNDWATER_RASTERS = {
+        "equilibrium_infiltration_rate_file": "Equilibrium infiltration rate [mm/d]",
+        "groundwater_hydraulic_conductivity_file": "Hydraulic conductivity [m/day]",
+        "groundwater_impervious_layer_level_file": "Impervious layer level [m MSL]",
+        "infiltration_decay_period_file": "Infiltration decay period [d]",
+        "initial_infiltration_rate_file": "Initial infiltration rate [mm/d]",
+        "leakage_file": "Leakage [mm/d]",
+        "phreatic_storage_capacity_file": "Phreatic storage capacity [-]",
+    }
+    _INTERFLOW_RASTERS = {
+        "hydraulic_conductivity_file": "Hydraulic conductivity [m/d]",
+        "porosity_file": "Porosity [-]",
+    }
+    _VEGETATION_DRAG_RASTERS = {
+        "vegetation_height_file": "Vegetation height [m]",
+        "vegetation_stem_count_file": "Vegetation stem count [-]",
+        "vegetation_stem_diameter_file": "Vegetation stem diameter [m]",
+        "vegetation_drag_coefficient_file": "Vegetation drag coefficient [-]",
+    }
+    _RASTER_REFERENCE_TABLES = {
+        "model_settings": _MODEL_SETTINGS_RASTERS,
+        "initial_conditions": _INITIAL_CONDITIONS_RASTERS,
+        "interception": _INTERCEPTION_RASTERS,
+        "simple_infiltration": _SIMPLE_INFILTRATION_RASTERS,
+        "groundwater": _GROUNDWATER_RASTERS,
+        "interflow": _INTERFLOW_RASTERS,
+        "vegetation_drag_2d": _VEGETATION_DRAG_RASTERS,
+    }
+    _RASTER_TABLE_MAPPING = {
+        raster_type: table_name
+        for table_name, raster_files_references in _RASTER_REFERENCE_TABLES.items()
+        for raster_type in raster_files_references
+    }
 
-    @staticmethod
-    def api_to_settings_raster_types():
-        raster_type_map = {
-            v: k
-            for k, v in SchematisationRasterReferences.settings_to_api_raster_types().items()
-        }
-        return raster_type_map
+    @classmethod
+    def settings_to_api_raster_types(cls):
+        return cls._SETTINGS_TO_API_RASTER_TYPES
 
-    @staticmethod
-    def api_client_raster_type(settings_raster_type):
-        try:
-            return SchematisationRasterReferences.settings_to_api_raster_types()[
-                settings_raster_type
-            ]
-        except KeyError:
-            return settings_raster_type
+    @classmethod
+    def api_to_settings_raster_types(cls):
+        return cls._API_TO_SETTINGS_RASTER_TYPES
 
-    @staticmethod
-    def settings_raster_type(api_raster_type):
-        try:
-            return SchematisationRasterReferences.api_to_settings_raster_types()[
-                api_raster_type
-            ]
-        except KeyError:
-            return api_raster_type
+    @classmethod
+    def api_client_raster_type(cls, settings_raster_type):
+        return cls._SETTINGS_TO_API_RASTER_TYPES.get(
+            settings_raster_type, settings_raster_type
+        )
 
-    @staticmethod
-    def model_settings_rasters():
+    @classmethod
+    def settings_raster_type(cls, api_raster_type):
+        return cls._API_TO_SETTINGS_RASTER_TYPES.get(api_raster_type, api_raster_type)
+
+    @classmethod
+    def model_settings_rasters(cls):
         """Rasters mapping from the Model settings layer."""
-        raster_info = OrderedDict(
-            (
-                ("dem_file", "Digital elevation model [m MSL]"),
-                ("friction_coefficient_file", "Friction coefficient [-]"),
-            )
-        )
-        return raster_info
+        return cls._MODEL_SETTINGS_RASTERS
 
-    @staticmethod
-    def initial_conditions_rasters():
+    @classmethod
+    def initial_conditions_rasters(cls):
         """Rasters mapping for the Initial conditions."""
-        raster_info = OrderedDict(
-            (
-                ("initial_groundwater_level_file", "Initial groundwater level [m MSL]"),
-                ("initial_water_level_file", "Initial water level [m MSL]"),
-            )
-        )
-        return raster_info
+        return cls._INITIAL_CONDITIONS_RASTERS
 
-    @staticmethod
-    def interception_rasters():
+    @classmethod
+    def interception_rasters(cls):
         """Rasters mapping for the Interception."""
-        raster_info = OrderedDict((("interception_file", "Interception [m]"),))
-        return raster_info
+        return cls._INTERCEPTION_RASTERS
 
-    @staticmethod
-    def simple_infiltration_rasters():
+    @classmethod
+    def simple_infiltration_rasters(cls):
         """Rasters mapping for the Infiltration."""
-        raster_info = OrderedDict(
-            (
-                ("infiltration_rate_file", "Infiltration rate [mm/d]"),
-                ("max_infiltration_volume_file", "Max infiltration volume [m]"),
-            )
-        )
-        return raster_info
+        return cls._SIMPLE_INFILTRATION_RASTERS
 
-    @staticmethod
-    def groundwater_rasters():
+    @classmethod
+    def groundwater_rasters(cls):
         """Rasters mapping for the Groundwater."""
-        raster_info = OrderedDict(
-            (
-                (
-                    "equilibrium_infiltration_rate_file",
-                    "Equilibrium infiltration rate [mm/d]",
-                ),
-                (
-                    "groundwater_hydraulic_conductivity_file",
-                    "Hydraulic conductivity [m/day]",
-                ),
-                (
-                    "groundwater_impervious_layer_level_file",
-                    "Impervious layer level [m MSL]",
-                ),
-                ("infiltration_decay_period_file", "Infiltration decay period [d]"),
-                ("initial_infiltration_rate_file", "Initial infiltration rate [mm/d]"),
-                ("leakage_file", "Leakage [mm/d]"),
-                ("phreatic_storage_capacity_file", "Phreatic storage capacity [-]"),
-            )
-        )
-        return raster_info
+        return cls._GROUNDWATER_RASTERS
 
-    @staticmethod
-    def interflow_rasters():
+    @classmethod
+    def interflow_rasters(cls):
         """Rasters mapping for the Interflow."""
-        raster_info = OrderedDict(
-            (
-                ("hydraulic_conductivity_file", "Hydraulic conductivity [m/d]"),
-                ("porosity_file", "Porosity [-]"),
-            )
-        )
-        return raster_info
+        return cls._INTERFLOW_RASTERS
 
-    @staticmethod
-    def vegetation_drag_rasters():
+    @classmethod
+    def vegetation_drag_rasters(cls):
         """Rasters mapping for the Vegetation drag settings."""
-        raster_info = OrderedDict(
-            (
-                ("vegetation_height_file", "Vegetation height [m]"),
-                ("vegetation_stem_count_file", "Vegetation stem count [-]"),
-                ("vegetation_stem_diameter_file", "Vegetation stem diameter [m]"),
-                ("vegetation_drag_coefficient_file", "Vegetation drag coefficient [-]"),
-            )
-        )
-        return raster_info
+        return cls._VEGETATION_DRAG_RASTERS
 
     @classmethod
     def raster_reference_tables(cls):
         """GeoPackage tables mapping with references to the rasters."""
-        reference_tables = OrderedDict(
-            (
-                ("model_settings", cls.model_settings_rasters()),
-                ("initial_conditions", cls.initial_conditions_rasters()),
-                ("interception", cls.interception_rasters()),
-                ("simple_infiltration", cls.simple_infiltration_rasters()),
-                ("groundwater", cls.groundwater_rasters()),
-                ("interflow", cls.interflow_rasters()),
-                ("vegetation_drag_2d", cls.vegetation_drag_rasters()),
-            )
-        )
-        return reference_tables
+        return cls._RASTER_REFERENCE_TABLES
 
     @classmethod
     def raster_table_mapping(cls):
         """Rasters to geopackage tables mapping."""
-        table_mapping = {}
-        for (
-            table_name,
-            raster_files_references,
-        ) in cls.raster_reference_tables().items():
-            for raster_type in raster_files_references.keys():
-                table_mapping[raster_type] = table_name
-        return table_mapping
+        return cls._RASTER_TABLE_MAPPING
 
 
 class BuildOptionActions(Enum):
@@ -794,6 +737,7 @@ def resolve_schematisation_download_dir_auto(
         local_schematisation = LocalSchematisation(
             working_dir, schematisation_pk, schematisation_name, create=True
         )
+        local_schematisations[schematisation_pk] = local_schematisation
     local_schematisation.set_wip_revision(revision_number)
     schematisation_db_dir = local_schematisation.wip_revision.schematisation_dir
     wip_replace_requested = True
@@ -845,13 +789,36 @@ def download_required_files(
         revision_models = tc.fetch_schematisation_revision_3di_models(
             schematisation_pk, revision_pk
         )
+        rasters_dir = os.path.join(schematisation_db_dir, "rasters")
         rasters_downloads = []
+        # Rasters sharing content with one that is already local or queued are
+        # copied after the downloads instead of being fetched again
+        raster_copies = []
+        queued_rasters_by_etag = {}
         for raster_file in revision.rasters or []:
+            raster_filepath = os.path.join(rasters_dir, raster_file.name)
+            remote_file = getattr(raster_file, "file", None)
+            etag = getattr(remote_file, "etag", None)
+            if (
+                etag
+                and os.path.isfile(raster_filepath)
+                and is_file_checksum_equal(raster_filepath, etag)
+            ):
+                # Local copy is already up to date, skip downloading it again
+                queued_rasters_by_etag.setdefault(etag, raster_filepath)
+                continue
+            if etag in queued_rasters_by_etag:
+                source_filepath = queued_rasters_by_etag[etag]
+                if source_filepath != raster_filepath:
+                    raster_copies.append((source_filepath, raster_filepath))
+                continue
             raster_download = tc.download_schematisation_revision_raster(
                 raster_file.id, schematisation_pk, revision_pk
             )
             rasters_downloads.append((raster_file.name, raster_download))
-        number_of_steps = len(rasters_downloads) + 1
+            if etag:
+                queued_rasters_by_etag[etag] = raster_filepath
+        number_of_steps = len(rasters_downloads) + len(raster_copies) + 1
 
         gridadmin_file, gridadmin_download = (None, None)
         gridadmin_file_gpkg, gridadmin_download_gpkg = (None, None)
@@ -885,11 +852,23 @@ def download_required_files(
             schematisation_db_dir, revision_sqlite.file.filename
         )
         current_progress = 0
+        last_progress_time = None
 
         def _emit_progress(message="Downloading schematisation files"):
-            if progress_fn is not None:
-                progress = int((current_progress / number_of_steps) * 100)
-                progress_fn(progress, message)
+            nonlocal last_progress_time
+            if progress_fn is None:
+                return
+            # Coalesce updates for many small files, but always report the last one
+            now = monotonic()
+            if (
+                last_progress_time is not None
+                and current_progress < number_of_steps
+                and now - last_progress_time < PROGRESS_UPDATE_INTERVAL
+            ):
+                return
+            last_progress_time = now
+            progress = int((current_progress / number_of_steps) * 100)
+            progress_fn(progress, message)
 
         _emit_progress()
         get_download_file(sqlite_download, zip_filepath)
@@ -914,24 +893,38 @@ def download_required_files(
             get_download_file(gridadmin_download_gpkg, gpkg_filepath)
             current_progress += 1
             _emit_progress("Downloaded gridadmin geopackage")
-        for raster_filename, raster_download in rasters_downloads:
-            raster_filepath = os.path.join(
-                schematisation_db_dir, "rasters", raster_filename
-            )
-            get_download_file(raster_download, raster_filepath)
+        if rasters_downloads or raster_copies:
+            os.makedirs(rasters_dir, exist_ok=True)
+        if rasters_downloads:
+            # Download rasters concurrently so per-file latencies overlap
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_DOWNLOADS, len(rasters_downloads))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        get_download_file,
+                        raster_download,
+                        os.path.join(rasters_dir, raster_filename),
+                    ): raster_filename
+                    for raster_filename, raster_download in rasters_downloads
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    current_progress += 1
+                    _emit_progress(f"Downloaded {futures[future]}")
+        for source_filepath, raster_filepath in raster_copies:
+            shutil.copyfile(source_filepath, raster_filepath)
             current_progress += 1
-            _emit_progress(f"Downloaded {raster_filename}")
+            _emit_progress(f"Copied {os.path.basename(raster_filepath)}")
         expected_geopackage_path = os.path.join(
             schematisation_db_dir, schematisation_db_file
         )
-        if expected_geopackage_path.lower().endswith(".sqlite"):
-            expected_geopackage_path = (
-                expected_geopackage_path.rsplit(".", 1)[0] + ".gpkg"
-            )
+        geopackage_root, db_extension = os.path.splitext(expected_geopackage_path)
+        if db_extension.lower() == ".sqlite":
+            expected_geopackage_path = geopackage_root + ".gpkg"
         downloaded_geopackage_filepath = None
         if os.path.isfile(expected_geopackage_path):
             downloaded_geopackage_filepath = expected_geopackage_path
-        sleep(1)
         settings = QSettings()
         settings.setValue(
             "threedi/last_schematisation_folder", str(schematisation_db_dir)
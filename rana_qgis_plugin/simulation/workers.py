@@ -223,9 +223,9 @@ class SimulationRunner(QRunnable):
             upload_local_file(bc_upload, filepath)
             for ti in range(int(self.upload_timeout // 2)):
                 uploaded_bc = self.tc.fetch_boundarycondition_files(sim_id)[0]
-                if uploaded_bc.state == ThreediFileState.VALID.value:
+                if uploaded_bc.state == ThreediFileState.VALID:
                     break
-                elif uploaded_bc.state == ThreediFileState.INVALID.value:
+                elif uploaded_bc.state == ThreediFileState.INVALID:
                     state_detail = str(uploaded_bc.state_detail).strip("{}").strip()
                     err_msg = f"Failed to upload Boundary Conditions file due to the following reasons: {state_detail}"
                     raise SimulationRunnerError(err_msg)
@@ -264,9 +264,9 @@ class SimulationRunner(QRunnable):
                     for scf in self.tc.fetch_structure_control_files(sim_id)
                 }
                 uploaded_sc = uploaded_files[sc_upload.filename]
-                if uploaded_sc.state == ThreediFileState.VALID.value:
+                if uploaded_sc.state == ThreediFileState.VALID:
                     break
-                elif uploaded_sc.state == ThreediFileState.INVALID.value:
+                elif uploaded_sc.state == ThreediFileState.INVALID:
                     state_detail = str(uploaded_sc.state_detail).strip("{}").strip()
                     err_msg = f"Failed to upload Structure Controls file due to the following reasons: {state_detail}"
                     raise SimulationRunnerError(err_msg)
@@ -347,11 +347,9 @@ class SimulationRunner(QRunnable):
                         threedimodel_id, initial_waterlevel_id
                     )
                 )
-                if uploaded_initial_waterlevel.state == ThreediFileState.VALID.value:
+                if uploaded_initial_waterlevel.state == ThreediFileState.VALID:
                     break
-                elif (
-                    uploaded_initial_waterlevel.state == ThreediFileState.INVALID.value
-                ):
+                elif uploaded_initial_waterlevel.state == ThreediFileState.INVALID:
                     state_detail = (
                         str(uploaded_initial_waterlevel.state_detail)
                         .strip("{}")
@@ -362,7 +360,7 @@ class SimulationRunner(QRunnable):
                 else:
                     time.sleep(2)
 
-            if uploaded_initial_waterlevel.state != ThreediFileState.VALID.value:
+            if uploaded_initial_waterlevel.state != ThreediFileState.VALID:
                 state_detail = (
                     str(uploaded_initial_waterlevel.state_detail).strip("{}").strip()
                 )
@@ -445,12 +443,12 @@ class SimulationRunner(QRunnable):
                     )
                 if (
                     raster_task_2d
-                    and raster_task_2d.status == ThreediModelTaskStatus.SUCCESS.value
+                    and raster_task_2d.status == ThreediModelTaskStatus.SUCCESS
                 ):
                     break
                 elif (
                     raster_task_2d
-                    and raster_task_2d.status == ThreediModelTaskStatus.FAILURE.value
+                    and raster_task_2d.status == ThreediModelTaskStatus.FAILURE
                 ):
                     raise SimulationRunnerError(
                         f"Failed to process 2D raster: {local_raster_2d_name}"
@@ -522,12 +520,12 @@ class SimulationRunner(QRunnable):
                     )
                 if (
                     raster_task_gw
-                    and raster_task_gw.status == ThreediModelTaskStatus.SUCCESS.value
+                    and raster_task_gw.status == ThreediModelTaskStatus.SUCCESS
                 ):
                     break
                 elif (
                     raster_task_gw
-                    and raster_task_gw.status == ThreediModelTaskStatus.FAILURE.value
+                    and raster_task_gw.status == ThreediModelTaskStatus.FAILURE
                 ):
                     raise SimulationRunnerError(
                         f"Failed to process Groundwater raster: {local_raster_gw_name}"
@@ -685,14 +683,12 @@ class SimulationRunner(QRunnable):
                             )
                         if (
                             raster_task_ic
-                            and raster_task_ic.status
-                            == ThreediModelTaskStatus.SUCCESS.value
+                            and raster_task_ic.status == ThreediModelTaskStatus.SUCCESS
                         ):
                             break
                         elif (
                             raster_task_ic
-                            and raster_task_ic.status
-                            == ThreediModelTaskStatus.FAILURE.value
+                            and raster_task_ic.status == ThreediModelTaskStatus.FAILURE
                         ):
                             error_msg = f"Failed to process Initial Concentration raster: {local_raster_ic_name}"
                             raise SimulationRunnerError(error_msg)
@@ -769,9 +765,9 @@ class SimulationRunner(QRunnable):
                 uploaded_lateral = next(
                     (file for file in lateral_files if file.periodic != "daily"), None
                 )
-                if uploaded_lateral.state == ThreediFileState.VALID.value:
+                if uploaded_lateral.state == ThreediFileState.VALID:
                     break
-                elif uploaded_lateral.state == ThreediFileState.INVALID.value:
+                elif uploaded_lateral.state == ThreediFileState.INVALID:
                     state_detail = (
                         str(uploaded_lateral.state_detail).strip("{}").strip()
                     )
@@ -800,9 +796,9 @@ class SimulationRunner(QRunnable):
                 uploaded_dwf = next(
                     (file for file in lateral_files if file.periodic == "daily"), None
                 )
-                if uploaded_dwf.state == ThreediFileState.VALID.value:
+                if uploaded_dwf.state == ThreediFileState.VALID:
                     break
-                elif uploaded_dwf.state == ThreediFileState.INVALID.value:
+                elif uploaded_dwf.state == ThreediFileState.INVALID:
                     state_detail = str(uploaded_dwf.state_detail).strip("{}").strip()
                     err_msg = f"Failed to upload Dry Weather Flow file due to the following reasons: {state_detail}"
                     raise SimulationRunnerError(err_msg)
@@ -1430,14 +1426,14 @@ class SchematisationUploadProgressWorker(QRunnable):
                 time.sleep(self.TASK_CHECK_INTERVAL)
         if model_checker_task:
             status = model_checker_task.status
-            while status != ThreediModelTaskStatus.SUCCESS.value:
+            while status != ThreediModelTaskStatus.SUCCESS:
                 model_checker_task = self.tc.fetch_schematisation_revision_task(
                     model_checker_task.id, self.schematisation.id, self.revision.id
                 )
                 status = model_checker_task.status
-                if status == ThreediModelTaskStatus.SUCCESS.value:
+                if status == ThreediModelTaskStatus.SUCCESS:
                     break
-                elif status == ThreediModelTaskStatus.FAILURE.value:
+                elif status == ThreediModelTaskStatus.FAILURE:
                     err = RevisionUploadError(
                         f"Model checker failed:\n {model_checker_task.detail['message']}"
                     )
@@ -81,12 +81,29 @@ class ConflictError(Exception):
         super().__init__(msg)
 
 
-def simple_fetch(url: str, params: Optional[dict] = None) -> Optional[dict]:
+# Shared session so plain HTTP transfers (presigned up- and download URLs)
+# reuse pooled keep-alive connections instead of reconnecting per request
+_requests_session = requests.Session()
+
+
+def get_requests_session() -> requests.Session:
+    return _requests_session
+
+
+def close_requests_session():
+    _requests_session.close()
+
+
+def simple_fetch(
+    url: str,
+    params: Optional[dict] = None,
+    network_manager: Optional[NetworkManager] = None,
+) -> Optional[dict]:
     """Run a simple fetch for any endpoint"""
     if params is None:
         params = {}
-    authcfg_id = get_authcfg_id()
-    network_manager = NetworkManager(url, authcfg_id)
+    if network_manager is None:
+        network_manager = NetworkManager(url, get_authcfg_id())
     status, error = network_manager.fetch(params)
     if status:
         return network_manager.content
@@ -96,13 +113,17 @@ def simple_fetch(url: str, params: Optional[dict] = None) -> Optional[dict]:
 
 
 def single_fetch(
-    url: str, limit: int, offset: int, params: Optional[dict] = None
+    url: str,
+    limit: int,
+    offset: int,
+    params: Optional[dict] = None,
+    network_manager: Optional[NetworkManager] = None,
 ) -> Optional[dict]:
     """Perform a single fetch from a list endpoint."""
     if params is None:
         params = {}
     params.update({"limit": limit, "offset": offset})
-    return simple_fetch(url, params)
+    return simple_fetch(url, params, network_manager)
 
 
 def fetch_first(url: str, params: Optional[dict] = None) -> Optional[dict]:
@@ -114,13 +135,15 @@ def fetch_first(url: str, params: Optional[dict] = None) -> Optional[dict]:
 
 def paginated_fetch(url: str, limit: int, params: Optional[dict] = None) -> dict:
     """Fetch all items from a list endpoint."""
+    # All pages share the same endpoint, so reuse one network manager
+    network_manager = NetworkManager(url, get_authcfg_id())
     offset = 0
     full_response = {"total": 0, "items": []}
-    response = single_fetch(url, limit, offset, params)
+    response = single_fetch(url, limit, offset, params, network_manager)
     full_response["total"] = response["total"]
     full_response["items"] += response["items"]
     for offset in range(limit, response["total"], limit):
-        response = single_fetch(url, limit, offset, params)
+        response = single_fetch(url, limit, offset, params, network_manager)
         full_response["items"] += response.get("items")
     return full_response
 
@@ -576,7 +599,7 @@ def get_file_descriptor_style(descriptor_id: str, file_name: str):
     if status and redirect_url:
         try:
             headers = {"Content-Type": "application/zip"}
-            response = requests.get(redirect_url, headers=headers, timeout=10)
+            response = _requests_session.get(redirect_url, headers=headers, timeout=10)
             return response.content
         except requests.RequestException as e:
             return None
@@ -596,7 +619,7 @@ def get_publication_style(
     if status and redirect_url:
         try:
             headers = {"Content-Type": "application/zip"}
-            response = requests.get(redirect_url, headers=headers, timeout=10)
+            response = _requests_session.get(redirect_url, headers=headers, timeout=10)
             return response.content
         except requests.RequestException as e:
             return None
@@ -1,34 +1,42 @@
 import math
 import os
-import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Tuple
 from urllib.parse import parse_qs, urlparse
-from uuid import uuid4
 
-from osgeo import gdal
 from qgis.core import QgsProject, QgsVectorLayer
-from qgis.PyQt.QtCore import QBuffer, QByteArray, QIODevice, QSettings, Qt
-from qgis.PyQt.QtGui import QFont, QFontMetrics, QImage, QStandardItem
-from threedi_mi_utils import (
-    LocalRevision,
-    LocalSchematisation,
-    list_local_schematisations,
-)
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtGui import QFont, QFontMetrics, QStandardItem
 
 from rana_qgis_plugin.auth_3di import get_3di_auth
 from rana_qgis_plugin.simulation.threedi_calls import (
     get_api_client_with_personal_api_token,
 )
 from rana_qgis_plugin.utils.api import get_frontend_settings, get_tenant_details
-from rana_qgis_plugin.utils.settings import get_hcc_url_override, rana_cache_dir
+from rana_qgis_plugin.utils.settings import api_url, get_hcc_url_override
+
+# hcc url from the frontend settings per Rana api url
+_hcc_url_cache = {}
+# Last created 3Di api client, with the (token, hcc url) it was created for
+_threedi_api_cache = (None, None)
 
 
 def get_threedi_api():
+    global _threedi_api_cache
     _, personal_api_token = get_3di_auth()
-    hcc_url = get_hcc_url_override() or get_frontend_settings()["hcc_url"]
+    hcc_url = get_hcc_url_override()
+    if not hcc_url:
+        rana_api_url = api_url()
+        if rana_api_url not in _hcc_url_cache:
+            _hcc_url_cache[rana_api_url] = get_frontend_settings()["hcc_url"]
+        hcc_url = _hcc_url_cache[rana_api_url]
     hcc_url = hcc_url.rstrip("/")
-    threedi_api = get_api_client_with_personal_api_token(personal_api_token, hcc_url)
+    cache_key, threedi_api = _threedi_api_cache
+    if cache_key != (personal_api_token, hcc_url):
+        threedi_api = get_api_client_with_personal_api_token(
+            personal_api_token, hcc_url
+        )
+        _threedi_api_cache = ((personal_api_token, hcc_url), threedi_api)
     return threedi_api
 
 
@@ -40,29 +48,29 @@ def get_threedi_organisations(communication) -> list[str]:
     ]
 
 
+BYTE_SIZE_UNITS = ("Bytes", "KB", "MB", "GB", "TB")
+BYTE_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(BYTE_SIZE_UNITS)))
+
+
 def display_bytes(bytes: int) -> str:
-    sizes = ["Bytes", "KB", "MB", "GB", "TB"]
     if bytes == 0:
         return "0 Byte"
-    i = int(math.floor(math.log(bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(bytes / p, 2)
-    return f"{s} {sizes[i]}"
+    i = min((bytes.bit_length() - 1) // 10, len(BYTE_SIZE_UNITS) - 1)
+    s = round(bytes / BYTE_SIZE_DIVISORS[i], 2)
+    return f"{s} {BYTE_SIZE_UNITS[i]}"
 
 
-def elide_text(font: QFont, text: str, max_width: int) -> str:
-    # Calculate elided text based on font and max width
-    font_metrics = QFontMetrics(font)
-    return font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, max_width)
+_font_metrics_cache = {}
 
 
-def image_to_bytes(image: QImage) -> bytes:
-    """Convert QImage to bytes."""
-    byte_array = QByteArray()
-    buffer = QBuffer(byte_array)
-    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-    image.save(buffer, "PNG")
-    return bytes(byte_array.data())
+def elide_text(font: QFont, text: str, max_width: int) -> str:
+    # Calculate elided text based on font and max width, reusing the metrics
+    # of fonts we have seen before
+    font_key = font.key()
+    font_metrics = _font_metrics_cache.get(font_key)
+    if font_metrics is None:
+        font_metrics = _font_metrics_cache[font_key] = QFontMetrics(font)
+    return font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, max_width)
 
 
 class NumericItem(QStandardItem):
@@ -75,8 +83,8 @@ class NumericItem(QStandardItem):
 def parse_url(url: str) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
     """Returns dict with path params and dict with query params"""
     parsed = urlparse(url)
-    # Remove leading slash and then split
-    path_parts = parsed.path.strip("/").split("/")
+    # Remove leading slash and then split, only the first parts are needed
+    path_parts = parsed.path.strip("/").split("/", 3)
     path_params = {
         "tenant_id": path_parts[0],
         "project_id": path_parts[2],
@@ -112,20 +120,21 @@ def split_scenario_extent(grid, resolution=None, max_pixel_count=1 * 10**8):
         y2 = (pixelcount_y * pixelsize_y) + y1
     raster_pixel_count = pixelcount_x * pixelcount_y
     if raster_pixel_count > max_pixel_count:
-        max_pixel_per_axis = int(math.sqrt(max_pixel_count))
+        max_pixel_per_axis = math.isqrt(int(max_pixel_count))
         columns_count = math.ceil(pixelcount_x / max_pixel_per_axis)
         rows_count = math.ceil(pixelcount_y / max_pixel_per_axis)
         sub_pixelcount_x = max_pixel_per_axis * pixelsize_x
         sub_pixelcount_y = max_pixel_per_axis * pixelsize_y
-        bboxes = []
-        for column_idx in range(columns_count):
-            sub_x1 = x1 + (column_idx * sub_pixelcount_x)
-            sub_x2 = sub_x1 + sub_pixelcount_x
-            for row_idx in range(rows_count):
-                sub_y1 = y1 + (row_idx * sub_pixelcount_y)
-                sub_y2 = sub_y1 + sub_pixelcount_y
-                sub_bbox = (sub_x1, sub_y1, sub_x2, sub_y2)
-                bboxes.append(sub_bbox)
+        # The row offsets are the same for every column, compute them once
+        sub_x1s = [
+            x1 + (column_idx * sub_pixelcount_x) for column_idx in range(columns_count)
+        ]
+        sub_y1s = [y1 + (row_idx * sub_pixelcount_y) for row_idx in range(rows_count)]
+        bboxes = [
+            (sub_x1, sub_y1, sub_x1 + sub_pixelcount_x, sub_y1 + sub_pixelcount_y)
+            for sub_x1 in sub_x1s
+            for sub_y1 in sub_y1s
+        ]
         spatial_bounds = (bboxes, sub_pixelcount_x, sub_pixelcount_y)
     else:
         bboxes = [(x1, y1, x2, y2)]
@@ -133,12 +142,33 @@ def split_scenario_extent(grid, resolution=None, max_pixel_count=1 * 10**8):
     return spatial_bounds
 
 
-def build_vrt(output_filepath, raster_filepaths, **vrt_options):
-    """Build VRT for the list of rasters."""
+def build_vrt(
+    output_filepath, raster_filepaths, skip_sidecar_files=False, **vrt_options
+):
+    """Build VRT for the list of rasters.
+
+    Pass skip_sidecar_files=True when the rasters are known to have no sidecar
+    files (.aux.xml, .ovr, ...), to skip the directory listing GDAL does when
+    opening each of them.
+    """
+    from osgeo import gdal
+
     gdal.UseExceptions()
     options = gdal.BuildVRTOptions(**vrt_options)
-    vrt_ds = gdal.BuildVRT(output_filepath, raster_filepaths, options=options)
-    vrt_ds = None
+    if skip_sidecar_files:
+        # Only for this thread, QGIS keeps its own settings
+        previous_readdir = gdal.GetThreadLocalConfigOption(
+            "GDAL_DISABLE_READDIR_ON_OPEN", None
+        )
+        gdal.SetThreadLocalConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+    try:
+        vrt_ds = gdal.BuildVRT(output_filepath, raster_filepaths, options=options)
+        vrt_ds = None
+    finally:
+        if skip_sidecar_files:
+            gdal.SetThreadLocalConfigOption(
+                "GDAL_DISABLE_READDIR_ON_OPEN", previous_readdir
+            )
 
 
 def get_file_icon_name(data_type: str) -> str:
@@ -13,6 +13,8 @@ from threedi_mi_utils import (
 
 from rana_qgis_plugin.utils.settings import rana_cache_dir
 
+INVALID_PATH_CHARS = re.compile(r'[<>:"/\\|?*]')
+
 
 def is_writable(working_dir: str) -> bool:
     """Try to write and remove an empty text file into given location."""
@@ -33,11 +35,9 @@ def sanitize_path_for_filesystem(path: str) -> str:
     Sanitize a path to be valid for Linux and Windows
     """
 
-    INVALID_CHARS = r'[<>:"/\\|?*]'
-
     def clean_part(part: str) -> str:
         # Replace invalid characters with underscore
-        part = re.sub(INVALID_CHARS, "_", part)
+        part = INVALID_PATH_CHARS.sub("_", part)
         # Strip trailing spaces and dots (Windows limitation)
         part = part.rstrip(" .")
         return part
@@ -66,28 +66,31 @@ def sanitize_path_for_filesystem(path: str) -> str:
     return str(sanitized_path)
 
 
-def get_local_dir_structure(project_slug: str, path: str) -> str:
-    file_name_without_extension = Path(path).stem
+def _get_local_dir_structure(project_slug: str, path_obj: Path) -> str:
     base_dir = Path(rana_cache_dir())
     local_dir_structure = base_dir.joinpath(
-        project_slug, "files", Path(path).parent, file_name_without_extension
+        project_slug, "files", path_obj.parent, path_obj.stem
     )
     return sanitize_path_for_filesystem(str(local_dir_structure))
 
 
+def get_local_dir_structure(project_slug: str, path: str) -> str:
+    return _get_local_dir_structure(project_slug, Path(path))
+
+
 def get_local_file_path(project_slug: str, path: str) -> str:
-    local_dir_structure = Path(get_local_dir_structure(project_slug, path))
-    file_name = sanitize_path_for_filesystem(Path(path).name)
-    return str(local_dir_structure.joinpath(file_name))
+    path_obj = Path(path)
+    local_dir_structure = _get_local_dir_structure(project_slug, path_obj)
+    file_name = sanitize_path_for_filesystem(path_obj.name)
+    return os.path.join(local_dir_structure, file_name)
 
 
 def get_local_publication_dir_structure(
     project_slug: str, path: str, publication_tree: list[str]
 ) -> str:
-    file_name_without_extension = Path(path).stem
     base_dir = Path(rana_cache_dir())
     local_dir_structure = base_dir.joinpath(
-        project_slug, "publications", *publication_tree, file_name_without_extension
+        project_slug, "publications", *publication_tree, Path(path).stem
     )
     return sanitize_path_for_filesystem(str(local_dir_structure))
 
@@ -108,15 +111,19 @@ def get_local_schematisation_revision_dir(
     schematisation_name: str,
     revision_number: int,
     create: bool = True,
+    local_schematisations: Optional[dict] = None,
 ) -> Optional[Path]:
     """Return the local revision directory for a schematisation.
 
     If create is True (default), creates the schematisation and revision structure
     if not found locally. If False, returns None when not found.
+    Pass local_schematisations (from list_local_schematisations) to reuse an
+    earlier scan of the working dir when resolving several directories.
     """
     if not working_dir or not schematisation_id:
         return None
-    local_schematisations = list_local_schematisations(working_dir)
+    if local_schematisations is None:
+        local_schematisations = list_local_schematisations(working_dir)
     local_schematisation = local_schematisations.get(schematisation_id)
     if not local_schematisation:
         if not create:
@@ -124,12 +131,15 @@ def get_local_schematisation_revision_dir(
         local_schematisation = LocalSchematisation(
             working_dir, schematisation_id, schematisation_name, create=True
         )
+        local_schematisations[schematisation_id] = local_schematisation
     local_revision = local_schematisation.revisions.get(revision_number)
     if not local_revision:
         if not create:
             return None
         local_revision = LocalRevision(local_schematisation, revision_number)
         local_revision.make_revision_structure()
+        # Keep a shared local_schematisations dict in sync with the disk
+        local_schematisation.revisions[revision_number] = local_revision
     return Path(local_revision.main_dir)
 
 
@@ -141,6 +151,7 @@ def get_local_results_dir(
     simulation_name: str,
     simulation_id: int,
     create: bool = True,
+    local_schematisations: Optional[dict] = None,
 ) -> Optional[str]:
     """Return the local results directory for a schematisation simulation.
 
@@ -148,7 +159,12 @@ def get_local_results_dir(
     If False, returns None when the revision directory is not found.
     """
     revision_dir = get_local_schematisation_revision_dir(
-        working_dir, schematisation_id, schematisation_name, revision_number, create
+        working_dir,
+        schematisation_id,
+        schematisation_name,
+        revision_number,
+        create,
+        local_schematisations,
     )
     if not revision_dir:
         return None
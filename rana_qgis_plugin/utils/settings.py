@@ -13,6 +13,9 @@ from rana_qgis_plugin.constant import (
     RANA_TENANT_ENTRY,
 )
 
+# The home directory doesn't change while QGIS runs, resolve it once
+DEFAULT_RANA_CACHE_DIR = str(Path.home() / "Rana")
+
 
 def initialize_settings():
     """Sets up the settings with default values"""
@@ -54,6 +57,26 @@ def get_tenant_id() -> str:
     return QgsSettings().value(RANA_TENANT_ENTRY)
 
 
+# In-process copy of the per-file last_modified entries, so repeated file
+# refreshes don't hit the settings backend when nothing changed
+_last_modified_cache = {}
+
+
+def get_file_last_modified(project_name: str, file_id: str) -> Optional[str]:
+    key = f"{project_name}/{file_id}/last_modified"
+    if key not in _last_modified_cache:
+        _last_modified_cache[key] = QgsSettings().value(key)
+    return _last_modified_cache[key]
+
+
+def set_file_last_modified(project_name: str, file_id: str, last_modified: str):
+    key = f"{project_name}/{file_id}/last_modified"
+    if key in _last_modified_cache and _last_modified_cache[key] == last_modified:
+        return
+    QgsSettings().setValue(key, last_modified)
+    _last_modified_cache[key] = last_modified
+
+
 def set_cognito_client_id(id: str):
     QgsSettings().setValue(f"{RANA_SETTINGS_ENTRY}/cognito_client_id", id)
 
@@ -112,7 +135,7 @@ def set_hcc_working_dir(working_dir: str) -> str:
 
 
 def rana_cache_dir(return_default=True) -> Optional[str]:
-    default = str(Path.home() / "Rana") if return_default else None
+    default = DEFAULT_RANA_CACHE_DIR if return_default else None
     return QgsSettings().value(f"{RANA_SETTINGS_ENTRY}/cache_dir", default)
 
 
@@ -1,21 +1,35 @@
 from datetime import datetime, timezone
 
-from dateutil import parser
-from dateutil.relativedelta import relativedelta
 from qgis.PyQt.QtCore import Qt
 
 from rana_qgis_plugin.utils.generic import NumericItem
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 
 def convert_to_numeric_timestamp(timestamp: str) -> float:
-    if timestamp.endswith("Z"):
-        timestamp = timestamp.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(timestamp)
-    return dt.timestamp()
+    return parse_timestamp_str(timestamp).timestamp()
 
 
 def parse_timestamp_str(timestamp: str) -> datetime:
-    return parser.isoparse(timestamp)
+    # Prefer the C parsers (ciso8601 when installed, else datetime.fromisoformat)
+    # and only fall back on dateutil for other ISO variants
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(timestamp)
+        except ValueError:
+            pass
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        from dateutil import parser
+
+        return parser.isoparse(timestamp)
 
 
 def convert_timestamp_str_to_local_time(timestamp: str) -> str:
@@ -35,18 +49,33 @@ def convert_timestamp_str_to_relative_time(timestamp: str) -> str:
 def convert_timestamp_to_relative_time(past: datetime) -> str:
     """Convert a timestamp into a relative time string."""
     now = datetime.now(timezone.utc)
-    delta = relativedelta(now, past)
-
-    if delta.years > 0:
-        return f"{delta.years} year{'s' if delta.years > 1 else ''} ago"
-    elif delta.months > 0:
-        return f"{delta.months} month{'s' if delta.months > 1 else ''} ago"
-    elif delta.days > 0:
-        return f"{delta.days} day{'s' if delta.days > 1 else ''} ago"
-    elif delta.hours > 0:
-        return f"{delta.hours} hour{'s' if delta.hours > 1 else ''} ago"
-    elif delta.minutes > 0:
-        return f"{delta.minutes} minute{'s' if delta.minutes > 1 else ''} ago"
+    elapsed = now - past
+    # Also covers timestamps slightly in the future (server clock ahead), for
+    # which a negative timedelta would otherwise read as "23 hours ago"
+    if elapsed.total_seconds() < 60:
+        return "Just now"
+    # Less than 28 days can never span a calendar month, so the calendar
+    # arithmetic of relativedelta is only needed for older timestamps
+    if elapsed.days >= 28:
+        from dateutil.relativedelta import relativedelta
+
+        delta = relativedelta(now, past)
+        if delta.years > 0:
+            return f"{delta.years} year{'s' if delta.years > 1 else ''} ago"
+        elif delta.months > 0:
+            return f"{delta.months} month{'s' if delta.months > 1 else ''} ago"
+        days = delta.days
+    else:
+        days = elapsed.days
+    hours, remainder = divmod(elapsed.seconds, 3600)
+    minutes = remainder // 60
+
+    if days > 0:
+        return f"{days} day{'s' if days > 1 else ''} ago"
+    elif hours > 0:
+        return f"{hours} hour{'s' if hours > 1 else ''} ago"
+    elif minutes > 0:
+        return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
     else:
         return "Just now"
 
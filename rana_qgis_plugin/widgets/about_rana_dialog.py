@@ -1,11 +1,13 @@
 import os.path
 
-from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt.uic import loadUi
+from qgis.PyQt import uic
 
+uicls, basecls = uic.loadUiType(
+    os.path.join(os.path.dirname(__file__), "ui", "about_rana_dialog.ui")
+)
 
-class AboutRanaDialog(QDialog):
+
+class AboutRanaDialog(uicls, basecls):
     def __init__(self, parent):
         super(AboutRanaDialog, self).__init__(parent)
-        ui_fn = os.path.join(os.path.dirname(__file__), "ui", "about_rana_dialog.ui")
-        loadUi(ui_fn, self)
+        self.setupUi(self)
@@ -6,7 +6,6 @@ from typing import Any, Callable, Optional
 from qgis.core import QgsApplication
 from qgis.gui import QgsCollapsibleGroupBox
 from qgis.PyQt.QtCore import (
-    QSettings,
     Qt,
     QUrl,
     pyqtSignal,
@@ -60,7 +59,7 @@ from rana_qgis_plugin.utils.local_paths import (
     get_local_results_dir_from_meta,
     get_local_schematisation_revision_dir,
 )
-from rana_qgis_plugin.utils.settings import hcc_working_dir
+from rana_qgis_plugin.utils.settings import hcc_working_dir, set_file_last_modified
 from rana_qgis_plugin.utils.spatial import get_bbox_area_in_m2
 from rana_qgis_plugin.utils.time import (
     format_activity_timestamp,
@@ -1023,8 +1022,9 @@ class FileView(QWidget):
         # Only update if new file is still there
         if updated_file:
             self.update_selected_file(updated_file)
-            last_modified_key = (
-                f"{self.project['name']}/{self.selected_file['id']}/last_modified"
+            set_file_last_modified(
+                self.project["name"],
+                self.selected_file["id"],
+                self.selected_file["last_modified"],
             )
-            QSettings().setValue(last_modified_key, self.selected_file["last_modified"])
             self.show_selected_file_details(self.selected_file)
@@ -706,7 +706,8 @@ class FilesBrowser(QWidget):
 
         # Add files second
         for file in files:
-            file_name = os.path.basename(file["id"].rstrip("/"))
+            # Only directory ids end with a slash
+            file_name = os.path.basename(file["id"])
             file_icon = get_icon_from_theme(get_file_icon_name(file["data_type"]))
             name_item = QStandardItem(file_icon, file_name)
             name_item.setToolTip(file_name)
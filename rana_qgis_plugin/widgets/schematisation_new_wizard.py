@@ -301,8 +301,9 @@ class UploadExistingSchematisationWizard(QWizard):
             src_db = self.gpkg_path
             schema_is_valid = ensure_valid_schema(src_db, self.communication)
             if schema_is_valid is True:
-                if src_db.lower().endswith(".sqlite"):
-                    src_db = src_db.rsplit(".", 1)[0] + ".gpkg"
+                src_db_root, src_db_extension = os.path.splitext(src_db)
+                if src_db_extension.lower() == ".sqlite":
+                    src_db = src_db_root + ".gpkg"
             else:
                 return  # ensure_valid_schema deals with showing errors.
 
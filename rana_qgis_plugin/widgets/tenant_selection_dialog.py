@@ -1,13 +1,13 @@
 import os.path
 
-from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt.uic import loadUi
+from qgis.PyQt import uic
 
+uicls, basecls = uic.loadUiType(
+    os.path.join(os.path.dirname(__file__), "ui", "tenant_selection_dialog.ui")
+)
 
-class TenantSelectionDialog(QDialog):
+
+class TenantSelectionDialog(uicls, basecls):
     def __init__(self, parent):
         super(TenantSelectionDialog, self).__init__(parent)
-        ui_fn = os.path.join(
-            os.path.dirname(__file__), "ui", "tenant_selection_dialog.ui"
-        )
-        loadUi(ui_fn, self)
+        self.setupUi(self)
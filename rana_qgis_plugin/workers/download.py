@@ -3,6 +3,7 @@ import shutil
 import tempfile
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import cached_property
 from pathlib import Path
 from time import sleep
@@ -23,6 +24,7 @@ from rana_qgis_plugin.utils.api import (
     get_file_descriptor_style,
     get_publication_style,
     get_raster_file_link,
+    get_requests_session,
     get_tenant_file_descriptor,
     get_tenant_file_url,
     request_raster_generate,
@@ -44,6 +46,13 @@ from rana_qgis_plugin.utils.qgis import rescale_qml_file
 from rana_qgis_plugin.utils.scenario import ScenarioInfo
 
 CHUNK_SIZE = 1024 * 1024  # 1 MB
+DOWNLOAD_TIMEOUT = (5, 60)  # connect and read timeout in seconds
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# ETag, server last_modified and local mtime of files downloaded in this session,
+# keyed by local path, used to skip re-downloading a file that is unchanged both
+# locally and on the server
+_download_validators = {}
 
 
 class SchematisationUpgradeError(Exception):
@@ -182,11 +191,13 @@ class ResultsDownloadContext(AbstractDownloadContext):
         project_slug: str,
         file_id: str,
         filename: str = "",
+        local_schematisations: Optional[dict] = None,
     ):
         self.scenario_info = scenario_info
         self.project_slug = project_slug
         self.file_id = file_id
         self.filename = filename
+        self.local_schematisations = local_schematisations
 
     @cached_property
     def local_dir(self) -> Path:
@@ -203,6 +214,7 @@ class ResultsDownloadContext(AbstractDownloadContext):
                         "\\", "-"
                     ),
                     self.scenario_info.simulation_id,
+                    local_schematisations=self.local_schematisations,
                 )
             )
         return Path(get_local_dir_structure(self.project_slug, self.file_id))
@@ -231,13 +243,54 @@ class BaseDownloader:
     def postprocess(self):
         raise NotImplementedError
 
+    @property
+    def last_modified(self) -> Optional[str]:
+        return None
+
+    def is_local_file_current(self) -> bool:
+        """Check whether the local file is an untouched copy of the server version"""
+        local_file_path = self.download_context.local_file_path
+        validator = _download_validators.get(str(local_file_path))
+        if not validator or not local_file_path.exists():
+            return False
+        _, last_modified, mtime_ns = validator
+        return (
+            last_modified is not None
+            and last_modified == self.last_modified
+            and local_file_path.stat().st_mtime_ns == mtime_ns
+        )
+
     @staticmethod
     def download_url(
-        url, target_file: Path, progress_signal, progress_min=0, progress_max=100
+        url,
+        target_file: Path,
+        progress_signal,
+        progress_min=0,
+        progress_max=100,
+        last_modified=None,
     ):
         """Download a URL to a file, emitting progress signals."""
-        with requests.get(url, stream=True) as response:
+        headers = {}
+        # Drop the validator up front, so a failed download can't leave a
+        # stale entry for a partially written file behind
+        validator = _download_validators.pop(str(target_file), None)
+        if validator and target_file.exists():
+            etag, _, mtime_ns = validator
+            # Only trust the local copy if it wasn't modified after the download
+            if etag and target_file.stat().st_mtime_ns == mtime_ns:
+                headers["If-None-Match"] = etag
+        with get_requests_session().get(
+            url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
             response.raise_for_status()
+            if response.status_code == 304:
+                _download_validators[str(target_file)] = (
+                    validator[0],
+                    last_modified,
+                    validator[2],
+                )
+                progress_signal.emit(progress_max, str(target_file))
+                return
             target_file.parent.mkdir(parents=True, exist_ok=True)
             total_size = int(response.headers.get("content-length", 0))
             progress_frac = (
@@ -253,17 +306,27 @@ class BaseDownloader:
                     if progress > previous_progress:
                         progress_signal.emit(progress, str(target_file))
                         previous_progress = progress
+            etag = response.headers.get("ETag")
+            if etag or last_modified:
+                _download_validators[str(target_file)] = (
+                    etag,
+                    last_modified,
+                    target_file.stat().st_mtime_ns,
+                )
 
     def download_file(self, signals: FileDownloadWorkerSignals, download_file=True):
         """Handles the core logic for downloading a file and emits signals from the worker."""
-        self.download_context.local_dir.mkdir(parents=True, exist_ok=True)
         try:
-            if download_file:
+            if download_file and not self.is_local_file_current():
                 self.download_url(
                     self.url,
                     self.download_context.local_file_path,
                     signals.progress,
+                    last_modified=self.last_modified,
                 )
+            # Only create the local directory once the download succeeded, so a
+            # failing url doesn't leave empty directories behind
+            self.download_context.local_dir.mkdir(parents=True, exist_ok=True)
             self.postprocess()
             # Emit finished signal from the worker
             signals.finished.emit()
@@ -300,6 +363,10 @@ class RanaDownloader(BaseDownloader):
     def file_id(self) -> str:
         return self.file["id"]
 
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.file.get("last_modified")
+
 
 class RanaFileDownloader(RanaDownloader):
     """Downloads a tenant file and applies QML styling.
@@ -703,29 +770,43 @@ class LizardResultDownloader(BaseDownloader):
 
             while False in [task["downloaded"] for task in rasters.values()]:
                 sleep(5)
-                for raster_task_id in rasters.keys():
-                    if not rasters[raster_task_id]["downloaded"]:
-                        try:
-                            file_link = get_raster_file_link(
-                                descriptor_id=self.descriptor_id,
-                                task_id=raster_task_id,
-                            )
-                            if file_link:
-                                self._download_tile(
-                                    file_link, rasters[raster_task_id]["filepath"]
-                                )
-                                rasters[raster_task_id]["downloaded"] = True
-                                task_counter += 1
-                                progress = int(
-                                    10 + (task_counter / len(raster_tasks)) * 80
-                                )
-                                signals.progress.emit(progress, file_name)
-                        except requests.exceptions.RequestException as e:
-                            signals.failed.emit(f"Failed to download file: {str(e)}")
-                            return
-                        except Exception as e:
-                            signals.failed.emit(f"An error occurred: {str(e)}")
-                            return
+                try:
+                    ready_tiles = {}
+                    for raster_task_id, raster in rasters.items():
+                        if raster["downloaded"]:
+                            continue
+                        file_link = get_raster_file_link(
+                            descriptor_id=self.descriptor_id,
+                            task_id=raster_task_id,
+                        )
+                        if file_link:
+                            ready_tiles[raster_task_id] = file_link
+                    if not ready_tiles:
+                        continue
+                    # Download the tiles that are ready concurrently
+                    with ThreadPoolExecutor(
+                        max_workers=min(MAX_CONCURRENT_DOWNLOADS, len(ready_tiles))
+                    ) as executor:
+                        futures = {
+                            executor.submit(
+                                self._download_tile,
+                                file_link,
+                                rasters[raster_task_id]["filepath"],
+                            ): raster_task_id
+                            for raster_task_id, file_link in ready_tiles.items()
+                        }
+                        for future in as_completed(futures):
+                            future.result()
+                            rasters[futures[future]]["downloaded"] = True
+                            task_counter += 1
+                            progress = int(10 + (task_counter / len(raster_tasks)) * 80)
+                            signals.progress.emit(progress, file_name)
+                except requests.exceptions.RequestException as e:
+                    signals.failed.emit(f"Failed to download file: {str(e)}")
+                    return
+                except Exception as e:
+                    signals.failed.emit(f"An error occurred: {str(e)}")
+                    return
 
             raster_filepaths = [item["filepath"] for item in rasters.values()]
             raster_filepaths.sort()
@@ -738,7 +819,10 @@ class LizardResultDownloader(BaseDownloader):
                 "resampleAlg": "nearest",
                 "srcNodata": self.nodata,
             }
-            build_vrt(vrt_filepath, raster_filepaths, **vrt_options)
+            # The Lizard tiles are freshly downloaded and have no sidecar files
+            build_vrt(
+                vrt_filepath, raster_filepaths, skip_sidecar_files=True, **vrt_options
+            )
             signals.progress.emit(100, file_name)
 
         # Single-tile: poll and download
@@ -772,11 +856,13 @@ class LizardResultDownloader(BaseDownloader):
     @staticmethod
     def _download_tile(file_link: str, target_file: str):
         """Download a single tile without progress tracking."""
-        with requests.get(file_link, stream=True) as response:
+        with get_requests_session().get(
+            file_link, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
             response.raise_for_status()
+            response.raw.decode_content = True
             with open(target_file, "wb") as f:
-                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
 
 
 class SingleFileDownloadWorker(QThread):
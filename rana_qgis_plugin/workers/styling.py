@@ -25,9 +25,6 @@ from rana_qgis_plugin.utils.api import (
     upload_publication_style,
 )
 from rana_qgis_plugin.utils.data_models import DataType, RanaPublicationFileData
-from rana_qgis_plugin.utils.generic import (
-    image_to_bytes,
-)
 from rana_qgis_plugin.utils.lizard import import_from_geostyler
 from rana_qgis_plugin.utils.local_paths import get_local_publication_file_path
 
@@ -195,8 +192,8 @@ class VectorStyleBuilder(StyleBuilder):
         files = []
         for name, img_data in png_data:
             png_path = self.tempdir.joinpath(name).with_suffix(".png")
-            with open(png_path, "wb") as f:
-                f.write(image_to_bytes(img_data))
+            # Let Qt encode straight to the file instead of via an in-memory copy
+            img_data.save(str(png_path), "PNG")
             files.append(("files", png_path.name, str(png_path), "image/png"))
         return files
 
@@ -1,9 +1,7 @@
 from pathlib import Path
 from typing import Optional
 
-import requests
 from qgis.PyQt.QtCore import (
-    QSettings,
     QThread,
     pyqtSignal,
     pyqtSlot,
@@ -11,13 +9,20 @@ from qgis.PyQt.QtCore import (
 
 from rana_qgis_plugin.utils.api import (
     finish_file_upload,
+    get_requests_session,
     get_tenant_file_descriptor,
     get_tenant_project_file,
     start_file_upload,
 )
 from rana_qgis_plugin.utils.local_paths import get_local_file_path
+from rana_qgis_plugin.utils.settings import (
+    get_file_last_modified,
+    set_file_last_modified,
+)
 from rana_qgis_plugin.utils.time import convert_timestamp_str_to_local_time
 
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 
 def _extract_case_conflict_path(error: dict) -> str | None:
     """Extract the conflicting server path from a 400 case-conflict error body.
@@ -173,8 +178,9 @@ class FileUploadWorker(QThread):
             upload_url = upload_response["urls"][0]
             # Step 2: Upload the file to the upload_url
             self.progress.emit(int(0.2 * progress_step + progress_start), "")
-            with open(local_path, "rb") as file:
-                response = requests.put(upload_url, data=file)
+            # Stream the file object so requests sets Content-Length from its size
+            with open(local_path, "rb", buffering=CHUNK_SIZE) as file:
+                response = get_requests_session().put(upload_url, data=file)
                 response.raise_for_status()
             # Step 3: Complete the upload
             self.progress.emit(int(0.8 * progress_step + progress_start), "")
@@ -210,7 +216,6 @@ class ExistingFileUploadWorker(FileUploadWorker):
 
         self.file_overwrite = False
         self.last_modified = None
-        self.last_modified_key = f"{project['name']}/{file['id']}/last_modified"
         self.file = file
 
         self.finished.connect(self._finish)
@@ -233,7 +238,9 @@ class ExistingFileUploadWorker(FileUploadWorker):
         return result
 
     def handle_file_conflict(self, online_path):
-        local_last_modified = QSettings().value(self.last_modified_key)
+        local_last_modified = get_file_last_modified(
+            self.project["name"], self.file["id"]
+        )
         server_file = get_tenant_project_file(self.project["id"], {"path": online_path})
         if not server_file:
             self.failed.emit(
@@ -254,4 +261,6 @@ class ExistingFileUploadWorker(FileUploadWorker):
         return True  # Continue to upload
 
     def _finish(self):
-        QSettings().setValue(self.last_modified_key, self.last_modified)
+        set_file_last_modified(
+            self.project["name"], self.file["id"], self.last_modified
+        )
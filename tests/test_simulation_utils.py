@@ -0,0 +1,81 @@
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import rana_qgis_plugin.simulation.utils as su
+
+RASTER_CONTENT = b"raster data"
+RASTER_ETAG = hashlib.md5(RASTER_CONTENT).hexdigest()
+
+
+def _write_download(download, file_path):
+    Path(file_path).write_bytes(RASTER_CONTENT)
+
+
+@pytest.fixture
+def threedi_calls(monkeypatch):
+    tc = MagicMock()
+    tc.fetch_schematisation_revision_3di_models.return_value = []
+    monkeypatch.setattr(su, "ThreediCalls", MagicMock(return_value=tc))
+    return tc
+
+
+@pytest.fixture(autouse=True)
+def download_mocks(monkeypatch):
+    monkeypatch.setattr(su, "get_download_file", _write_download)
+    monkeypatch.setattr(su, "unzip_archive", MagicMock(return_value=["db.gpkg"]))
+    monkeypatch.setattr(su, "QSettings", MagicMock())
+
+
+def _download(tmp_path, rasters):
+    schematisation = SimpleNamespace(id=1, name="foo")
+    revision = SimpleNamespace(
+        id=2,
+        number=3,
+        sqlite=SimpleNamespace(file=SimpleNamespace(filename="db.zip")),
+        rasters=rasters,
+    )
+    local_schematisation = MagicMock()
+    local_schematisation.revisions = {3: MagicMock()}
+    return su.download_required_files(
+        schematisation,
+        revision,
+        str(tmp_path),
+        local_schematisation,
+        True,
+        threedi_api=MagicMock(),
+    )
+
+
+def test_download_required_files_copies_rasters_sharing_an_etag(
+    tmp_path, threedi_calls
+):
+    rasters = [
+        SimpleNamespace(id=10, name="dem.tif", file=SimpleNamespace(etag=RASTER_ETAG)),
+        SimpleNamespace(id=11, name="dem2.tif", file=SimpleNamespace(etag=RASTER_ETAG)),
+        # download objects without an etag are always downloaded
+        SimpleNamespace(id=12, name="friction.tif", file=SimpleNamespace()),
+    ]
+    _download(tmp_path, rasters)
+    downloaded_ids = [
+        call.args[0]
+        for call in threedi_calls.download_schematisation_revision_raster.mock_calls
+    ]
+    assert sorted(downloaded_ids) == [10, 12]
+    assert (tmp_path / "rasters" / "dem2.tif").read_bytes() == RASTER_CONTENT
+
+
+def test_download_required_files_skips_up_to_date_rasters(tmp_path, threedi_calls):
+    rasters_dir = tmp_path / "rasters"
+    rasters_dir.mkdir()
+    (rasters_dir / "dem.tif").write_bytes(RASTER_CONTENT)
+    rasters = [
+        SimpleNamespace(id=10, name="dem.tif", file=SimpleNamespace(etag=RASTER_ETAG)),
+        SimpleNamespace(id=11, name="dem2.tif", file=SimpleNamespace(etag=RASTER_ETAG)),
+    ]
+    _download(tmp_path, rasters)
+    threedi_calls.download_schematisation_revision_raster.assert_not_called()
+    assert (rasters_dir / "dem2.tif").read_bytes() == RASTER_CONTENT
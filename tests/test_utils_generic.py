@@ -18,6 +18,7 @@ import rana_qgis_plugin.utils.generic as utils
         (1048576, "1.0 MB"),
         (1073741824, "1.0 GB"),
         (pow(1024, 4), "1.0 TB"),  # 1 Terabyte
+        (pow(1024, 5), "1024.0 TB"),  # Larger sizes stay in Terabytes
         (123456789, "117.74 MB"),
     ],
 )
@@ -229,6 +229,52 @@ def test_get_local_schematisation_revision_dir_creates(tmp_path, result_folder_i
     assert result.exists()
 
 
+def test_get_local_schematisation_revision_dir_reuses_scan(
+    tmp_path, monkeypatch, result_folder_info
+):
+    """Uses the passed local schematisations instead of scanning the working dir."""
+    list_mock = MagicMock()
+    monkeypatch.setattr(local_paths, "list_local_schematisations", list_mock)
+    local_schematisation = MagicMock()
+    local_schematisation.revisions = {
+        result_folder_info["revision_number"]: MagicMock(main_dir=str(tmp_path))
+    }
+    result = local_paths.get_local_schematisation_revision_dir(
+        str(tmp_path),
+        result_folder_info["schematisation_id"],
+        result_folder_info["schematisation_name"],
+        result_folder_info["revision_number"],
+        create=False,
+        local_schematisations={
+            result_folder_info["schematisation_id"]: local_schematisation
+        },
+    )
+    assert result == tmp_path
+    list_mock.assert_not_called()
+
+
+def test_get_local_schematisation_revision_dir_updates_scan(
+    tmp_path, result_folder_info
+):
+    """Registers created schematisations and revisions in the passed scan."""
+    local_schematisations = {}
+    result = local_paths.get_local_schematisation_revision_dir(
+        str(tmp_path),
+        result_folder_info["schematisation_id"],
+        result_folder_info["schematisation_name"],
+        result_folder_info["revision_number"],
+        create=True,
+        local_schematisations=local_schematisations,
+    )
+    local_schematisation = local_schematisations[
+        result_folder_info["schematisation_id"]
+    ]
+    local_revision = local_schematisation.revisions[
+        result_folder_info["revision_number"]
+    ]
+    assert Path(local_revision.main_dir) == result
+
+
 def test_get_local_results_dir_from_meta_complete(tmp_path, result_folder_info):
     """Returns results dir when meta is complete and revision exists."""
     workdir = tmp_path
@@ -26,6 +26,8 @@ def test_convert_to_local_time():
     "timestamp_str, expected_relative_time",
     [
         ("2023-01-10T12:00:00Z", "Just now"),
+        ("2023-01-10T12:00:02Z", "Just now"),
+        ("2023-01-10T13:00:00Z", "Just now"),
         ("2023-01-10T11:59:00Z", "1 minute ago"),
         ("2023-01-10T11:50:00Z", "10 minutes ago"),
         ("2023-01-10T11:00:00Z", "1 hour ago"),
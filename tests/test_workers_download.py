@@ -0,0 +1,112 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+import rana_qgis_plugin.workers.download as download
+
+URL = "https://example.com/file.tif"
+
+
+@pytest.fixture(autouse=True)
+def download_validators(monkeypatch):
+    validators = {}
+    monkeypatch.setattr(download, "_download_validators", validators)
+    return validators
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = MagicMock()
+    monkeypatch.setattr(download, "get_requests_session", lambda: session)
+    return session
+
+
+def _respond(session, status_code=200, content=b"data", etag="abc", error=None):
+    response = MagicMock(status_code=status_code)
+    response.headers = {"content-length": str(len(content))}
+    if etag:
+        response.headers["ETag"] = etag
+    response.iter_content.return_value = [content]
+    if error:
+        response.raise_for_status.side_effect = error
+    session.get.return_value.__enter__.return_value = response
+    return response
+
+
+def _sent_headers(session):
+    return session.get.call_args.kwargs["headers"]
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_download_url_stores_validator(tmp_path, session, download_validators):
+    target_file = tmp_path / "file.tif"
+    _respond(session)
+    download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    assert target_file.read_bytes() == b"data"
+    assert download_validators[str(target_file)] == (
+        "abc",
+        None,
+        target_file.stat().st_mtime_ns,
+    )
+
+
+def test_download_url_keeps_local_file_on_not_modified(
+    tmp_path, session, download_validators
+):
+    target_file = tmp_path / "file.tif"
+    _respond(session)
+    download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    _respond(session, status_code=304, content=b"", etag=None)
+    download.BaseDownloader.download_url(
+        URL, target_file, MagicMock(), last_modified="2024-01-01"
+    )
+    assert _sent_headers(session) == {"If-None-Match": "abc"}
+    assert target_file.read_bytes() == b"data"
+    assert download_validators[str(target_file)][:2] == ("abc", "2024-01-01")
+
+
+def test_download_url_ignores_validator_after_local_edit(tmp_path, session):
+    target_file = tmp_path / "file.tif"
+    _respond(session)
+    download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    _touch(target_file)
+    _respond(session, content=b"new data")
+    download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    assert _sent_headers(session) == {}
+    assert target_file.read_bytes() == b"new data"
+
+
+def test_download_url_drops_validator_on_failure(
+    tmp_path, session, download_validators
+):
+    target_file = tmp_path / "file.tif"
+    _respond(session)
+    download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    _respond(session, error=requests.exceptions.HTTPError("500"))
+    with pytest.raises(requests.exceptions.HTTPError):
+        download.BaseDownloader.download_url(URL, target_file, MagicMock())
+    assert str(target_file) not in download_validators
+
+
+def test_is_local_file_current(tmp_path, session):
+    target_file = tmp_path / "file.tif"
+    download_context = MagicMock(local_file_path=target_file)
+    file = {"id": "file.tif", "last_modified": "2024-01-01"}
+    downloader = download.RanaDownloader({"id": "project"}, file, download_context)
+    assert not downloader.is_local_file_current()
+    _respond(session)
+    download.BaseDownloader.download_url(
+        URL, target_file, MagicMock(), last_modified="2024-01-01"
+    )
+    assert downloader.is_local_file_current()
+    file["last_modified"] = "2024-01-02"
+    assert not downloader.is_local_file_current()
+    file["last_modified"] = "2024-01-01"
+    _touch(target_file)
+    assert not downloader.is_local_file_current()